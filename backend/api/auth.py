@@ -1,15 +1,22 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from starlette.requests import HTTPConnection
 from models.database import get_db, Contact
 from config import settings
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
@@ -19,16 +26,62 @@ SECRET_KEY = settings.secret_key
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
+class AdminCredentialStore:
+    """Admin user record whose password hash is derived once per process."""
+
+    def __init__(self):
+        self._user: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> dict:
+        """Build the admin record from a stored hash or by hashing the configured password once."""
+        with self._lock:
+            if self._user is None:
+                hashed_password = settings.admin_password_hash or None
+                if not hashed_password and settings.admin_password:
+                    hashed_password = pwd_context.hash(settings.admin_password)
+                self._user = {
+                    "username": settings.admin_username,
+                    "hashed_password": hashed_password,
+                    "full_name": "Admin User",
+                    "email": "admin@example.com",
+                    "disabled": False
+                }
+            return self._user
+
+    def get_user(self) -> dict:
+        """Return the admin record without doing any key derivation after the first load."""
+        return self._user if self._user is not None else self.load()
+
+    def verify(self, username: str, password: str) -> Optional[dict]:
+        """Check credentials and transparently upgrade a hash whose cost is out of date."""
+        admin_user = self.get_user()
+        if username != admin_user["username"] or not admin_user["hashed_password"]:
+            return None
+
+        valid, new_hash = pwd_context.verify_and_update(password, admin_user["hashed_password"])
+        if not valid:
+            return None
+        if new_hash:
+            with self._lock:
+                admin_user["hashed_password"] = new_hash
+        return admin_user
+
+    def set_password(self, new_password: str) -> str:
+        """Replace the in-memory admin hash and return it so it can be persisted."""
+        new_hash = pwd_context.hash(new_password)
+        admin_user = self.get_user()
+        with self._lock:
+            admin_user["hashed_password"] = new_hash
+        token_cache.revoke_all()
+        return new_hash
+
+credential_store = AdminCredentialStore()
+
 # Admin user configuration from environment variables
 def get_admin_user():
     """Get admin user configuration from environment variables."""
-    return {
-        "username": settings.admin_username,
-        "hashed_password": pwd_context.hash(settings.admin_password) if settings.admin_password else None,
-        "full_name": "Admin User",
-        "email": "admin@example.com",
-        "disabled": False
-    }
+    return credential_store.get_user()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -40,18 +93,85 @@ def get_password_hash(password: str) -> str:
 
 def authenticate_user(username: str, password: str) -> Optional[dict]:
     """Authenticate user with username and password."""
-    admin_user = get_admin_user()
-    
-    if username != admin_user["username"]:
-        return None
-    
-    if not admin_user["hashed_password"]:
-        return None
-    
-    if not verify_password(password, admin_user["hashed_password"]):
-        return None
-    
-    return admin_user
+    return credential_store.verify(username, password)
+
+# Password verification runs on a small dedicated pool so bcrypt never blocks the event loop
+_auth_executor = ThreadPoolExecutor(max_workers=settings.auth_worker_threads, thread_name_prefix="auth")
+_auth_pending = 0
+
+async def authenticate_user_async(username: str, password: str) -> Optional[dict]:
+    """Authenticate on the auth worker pool; refuses work when too many verifications are queued."""
+    global _auth_pending
+    if _auth_pending >= settings.auth_max_pending:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Login temporarily unavailable, please retry",
+            headers={"Retry-After": "1"},
+        )
+    _auth_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_auth_executor, authenticate_user, username, password)
+    finally:
+        _auth_pending -= 1
+
+def client_ip(connection: HTTPConnection) -> Optional[str]:
+    """Address of the client behind a request or WebSocket."""
+    # Fly's proxy sets Fly-Client-IP; fall back to the socket peer when running locally
+    return connection.headers.get("fly-client-ip") or (connection.client.host if connection.client else None)
+
+class LoginThrottle:
+    """Per-IP and per-username failed login tracking with exponential backoff."""
+
+    def __init__(self, free_attempts: int, base_delay: float, max_delay: float, max_keys: int = 10000):
+        self.free_attempts = free_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_keys = max_keys
+        # key -> (consecutive failures, blocked until, last failure)
+        self._failures: Dict[str, Tuple[int, float, float]] = {}
+
+    @staticmethod
+    def keys_for(client_ip: Optional[str], username: str) -> List[str]:
+        keys = [f"user:{username.strip().lower()}"]
+        if client_ip:
+            keys.append(f"ip:{client_ip}")
+        return keys
+
+    def retry_after(self, keys: List[str]) -> float:
+        """Seconds until any of the keys may attempt another login."""
+        now = time.monotonic()
+        return max([self._failures.get(key, (0, 0.0, 0.0))[1] - now for key in keys] + [0.0])
+
+    def record_failure(self, keys: List[str]) -> None:
+        now = time.monotonic()
+        for key in keys:
+            count, _, _ = self._failures.get(key, (0, 0.0, 0.0))
+            count += 1
+            blocked_until = 0.0
+            if count > self.free_attempts:
+                blocked_until = now + min(self.max_delay, self.base_delay * 2 ** (count - self.free_attempts - 1))
+            self._failures[key] = (count, blocked_until, now)
+        if len(self._failures) > self.max_keys:
+            self._prune(now)
+
+    def record_success(self, keys: List[str]) -> None:
+        for key in keys:
+            self._failures.pop(key, None)
+
+    def _prune(self, now: float) -> None:
+        # Forget keys whose last failure is older than the longest backoff
+        stale = [key for key, (_, _, last) in self._failures.items() if now - last > self.max_delay]
+        for key in stale:
+            del self._failures[key]
+        while len(self._failures) > self.max_keys:
+            self._failures.pop(next(iter(self._failures)))
+
+login_throttle = LoginThrottle(
+    free_attempts=settings.login_free_attempts,
+    base_delay=settings.login_backoff_base_seconds,
+    max_delay=settings.login_backoff_max_seconds,
+)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token."""
@@ -66,6 +186,81 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+class TokenCache:
+    """Bounded cache of verified JWT payloads, keyed by token digest and held until each token's exp."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.decode_seconds = 0.0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        digest = self._digest(token)
+        entry = self._entries.get(digest)
+        if entry is not None:
+            payload, expires_at = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return payload
+            del self._entries[digest]
+        self.misses += 1
+        return None
+
+    def decode(self, token: str) -> dict:
+        """Verify and decode a token, caching the payload until it expires."""
+        payload = self.get(token)
+        if payload is not None:
+            return payload
+
+        generation = self._generation
+        started = time.perf_counter()
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        self.decode_seconds += time.perf_counter() - started
+        self.decodes += 1
+
+        expires_at = payload.get("exp")
+        # Tokens revoked while we were decoding must not be re-cached
+        if isinstance(expires_at, (int, float)) and generation == self._generation:
+            self._entries[self._digest(token)] = (payload, float(expires_at))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def revoke_all(self) -> None:
+        """Forget every cached token, e.g. after the secret or admin credentials change."""
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        avg_decode = self.decode_seconds / self.decodes if self.decodes else 0.0
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "avg_decode_ms": round(avg_decode * 1000, 4),
+            "estimated_saved_ms": round(self.hits * avg_decode * 1000, 2),
+        }
+
+token_cache = TokenCache(settings.token_cache_max_entries)
+
+def rotate_secret_key(new_secret_key: str) -> None:
+    """Switch the JWT signing key; every previously issued token stops validating."""
+    global SECRET_KEY
+    SECRET_KEY = new_secret_key
+    token_cache.revoke_all()
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
     """Get current user from JWT token."""
     credentials_exception = HTTPException(
@@ -75,7 +270,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
     )
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = token_cache.decode(token)
         username = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -102,7 +297,5 @@ def generate_password_hash(password: str) -> str:
 # Example usage for updating admin password
 def update_admin_password(new_password: str) -> str:
     """Update admin password and return new hash"""
-    new_hash = generate_password_hash(new_password)
-    # In production, you would save this to database
-    # For now, you need to update the MOCK_USER["hashed_password"] manually
-    return new_hash 
\ No newline at end of file
+    # Set ADMIN_PASSWORD_HASH to the returned value to persist it across restarts
+    return credential_store.set_password(new_password)
@@ -0,0 +1,140 @@
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+from fastapi import Request
+from fastapi.responses import Response
+from config import settings
+from api.serialization import json_bytes_response
+from models.revisions import add_listener, process_started_at, table_last_modified, table_revision
+
+class ResponseCache:
+    """Bounded LRU of serialized JSON responses, invalidated per table."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Tuple[str, ...]]]" = OrderedDict()
+        self._keys_by_table: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get_or_load(self, key: Hashable, tables: Iterable[str], loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, awaiting loader on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        tables = tuple(tables)
+        revisions = [table_revision(table) for table in tables]
+        value = await loader()
+
+        with self._lock:
+            # Skip storing if one of the tables changed while we were loading
+            if revisions == [table_revision(table) for table in tables]:
+                self._store(key, tables, value)
+        return value
+
+    def _store(self, key: Hashable, tables: Tuple[str, ...], value: Any) -> None:
+        self._entries[key] = (value, tables)
+        self._entries.move_to_end(key)
+        for table in tables:
+            self._keys_by_table.setdefault(table, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            old_key, _ = self._entries.popitem(last=False)
+            self._forget(old_key)
+            self.evictions += 1
+
+    def _forget(self, key: Hashable) -> None:
+        for keys in self._keys_by_table.values():
+            keys.discard(key)
+
+    def invalidate_tables(self, tables: Iterable[str]) -> None:
+        """Drop every entry that was built from one of the given tables."""
+        with self._lock:
+            for table in tables:
+                for key in self._keys_by_table.pop(table, set()):
+                    entry = self._entries.pop(key, None)
+                    if entry is not None:
+                        self.invalidations += 1
+                        self._forget(key)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_table.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+response_cache = ResponseCache(settings.response_cache_max_entries)
+add_listener(response_cache.invalidate_tables)
+
+def validator_headers(tables: Iterable[str]) -> Dict[str, str]:
+    """Build ETag/Last-Modified headers from table revisions without touching the database."""
+    tables = sorted(tables)
+    version = ".".join(str(table_revision(table)) for table in tables)
+    last_modified = max(table_last_modified(table) for table in tables)
+    return {
+        "ETag": f'W/"{int(process_started_at()):x}-{version}"',
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: ignore the W/ prefix on both sides
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+def not_modified(request: Request, headers: Dict[str, str]) -> Optional[Response]:
+    """Return a 304 response if the client's validators are still current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return None
+        if int(parsedate_to_datetime(headers["Last-Modified"]).timestamp()) <= since:
+            return Response(status_code=304, headers=headers)
+    return None
+
+async def cached_json(request: Request, key: Hashable, tables: Iterable[str], loader: Callable[[], Awaitable[bytes]]) -> Response:
+    """Serve cached JSON bytes, answering conditional requests with 304."""
+    tables = tuple(tables)
+    headers = validator_headers(tables)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+    return json_bytes_response(await response_cache.get_or_load(key, tables, loader), headers=headers)
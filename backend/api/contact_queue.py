@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from config import settings
+from models.database import AsyncSessionLocal, Contact
+
+logger = logging.getLogger(__name__)
+
+# Group-commit queue for contact form submissions
+# Handlers enqueue a row and await its future; one writer task collects rows
+# for up to contact_batch_interval_ms or contact_batch_max_rows and inserts
+# them in a single transaction, so a burst of submissions costs one fsync per
+# batch instead of one per request. Shutdown stops intake and drains the queue.
+
+class QueueFullError(Exception):
+    """Raised when the queue already holds contact_queue_max_depth submissions."""
+
+class ContactWriteQueue:
+    """Batches contact inserts into shared transactions."""
+
+    def __init__(self, max_rows: int, interval: float, max_depth: int):
+        self.max_rows = max_rows
+        self.interval = interval
+        self.max_depth = max_depth
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._closing = False
+        self.batches = 0
+        self.rows = 0
+        self.failures = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.max_depth_seen = 0
+        self.commit_seconds = 0.0
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        if self._writer is None or self._writer.done():
+            self._queue = asyncio.Queue()
+            self._closing = False
+            self._writer = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting submissions and wait until every queued one is written."""
+        if self._writer is None:
+            return
+        self._closing = True
+        await self._queue.join()
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+
+    async def submit(self, name: str, email: str, message: str) -> Dict[str, Any]:
+        """Queue one submission and return the stored row once its batch commits."""
+        if self._closing:
+            raise QueueFullError("Contact queue is shutting down")
+        self.start()
+        if self._queue.qsize() >= self.max_depth:
+            raise QueueFullError("Contact queue is full")
+        values = {"name": name, "email": email, "message": message, "created_at": datetime.utcnow()}
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((values, future))
+        self.max_depth_seen = max(self.max_depth_seen, self._queue.qsize())
+        return await future
+
+    async def _next_batch(self) -> List[Tuple[Dict[str, Any], asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.interval
+        while len(batch) < self.max_rows:
+            # Take whatever is already waiting before sleeping on the deadline
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    insert(Contact).returning(Contact.id, sort_by_parameter_order=True),
+                    [values for values, _ in batch],
+                )
+                ids = list(result.scalars())
+                await db.commit()
+        except Exception as e:
+            self.failures += 1
+            logger.exception("Contact batch of %d failed", len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.commit_seconds += time.perf_counter() - started
+        self.batches += 1
+        self.rows += len(batch)
+        self.last_batch_size = len(batch)
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        for row_id, (values, future) in zip(ids, batch):
+            if not future.done():
+                future.set_result({"id": row_id, **values})
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def stats(self) -> dict:
+        """Queue depth and batch size counters for monitoring the queue."""
+        return {
+            "running": self._writer is not None and not self._writer.done(),
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_depth_seen": self.max_depth_seen,
+            "max_depth": self.max_depth,
+            "batches": self.batches,
+            "rows": self.rows,
+            "failures": self.failures,
+            "avg_batch_size": round(self.rows / self.batches, 2) if self.batches else 0.0,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "avg_commit_ms": round(self.commit_seconds / self.batches * 1000, 3) if self.batches else 0.0,
+        }
+
+contact_queue = ContactWriteQueue(
+    settings.contact_batch_max_rows,
+    settings.contact_batch_interval_ms / 1000,
+    settings.contact_queue_max_depth,
+)
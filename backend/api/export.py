@@ -0,0 +1,181 @@
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from models.database import SessionLocal, Hero, Project, SectionConfig, SectionTitle
+from models.models import HeroResponse, ProjectResponse, SectionConfigResponse, SectionTitleResponse, DEFAULT_SECTION_CONFIG
+from api.serialization import dump_json, serialize_row, serialize_rows
+from api.snapshot import SNAPSHOT_COLLECTIONS, PORTFOLIO_TABLES, build_portfolio_document
+
+# Static export of the public API
+# Every public GET is rendered to <out>/api/<path>.json plus a gzip copy so a
+# CDN can serve it without hitting the backend. manifest.json records each
+# file's content hash and the fingerprint of the tables it was built from, so
+# later runs only re-render files whose source tables changed.
+
+MANIFEST_NAME = "manifest.json"
+
+# Public collection routes, keyed by snapshot collection name
+COLLECTION_PATHS = {
+    "about": "api/about",
+    "experiences": "api/experiences",
+    "stats": "api/stats",
+    "awards": "api/awards",
+    "education": "api/education",
+    "certifications": "api/certifications",
+    "skills": "api/skills",
+    "projects": "api/projects",
+    "testimonials": "api/testimonials",
+    "contact_info": "api/contact-info",
+    "section_titles": "api/section-titles",
+}
+
+Renderer = Callable[[Session], Optional[bytes]]
+
+def _collection_renderer(model, schema) -> Renderer:
+    def render(db: Session) -> bytes:
+        rows = db.query(model).filter(model.is_active == True).order_by(model.order_index, model.id).all()
+        return serialize_rows(schema, rows)
+    return render
+
+def _render_hero(db: Session) -> Optional[bytes]:
+    return serialize_row(HeroResponse, db.query(Hero).filter(Hero.is_active == True).first())
+
+def _render_section_config(db: Session) -> bytes:
+    config = db.query(SectionConfig).first()
+    if not config:
+        now = datetime.utcnow()
+        config = SectionConfigResponse(id=0, config=DEFAULT_SECTION_CONFIG, created_at=now, updated_at=now)
+    return serialize_row(SectionConfigResponse, config)
+
+def _render_portfolio(db: Session) -> bytes:
+    return dump_json(build_portfolio_document(db))
+
+def _project_category_renderer(category: str) -> Renderer:
+    def render(db: Session) -> bytes:
+        projects = db.query(Project).filter(
+            Project.category == category,
+            Project.is_active == True
+        ).order_by(Project.order_index, Project.id).all()
+        return serialize_rows(ProjectResponse, projects)
+    return render
+
+def _section_title_renderer(section_name: str) -> Renderer:
+    def render(db: Session) -> Optional[bytes]:
+        section_title = db.query(SectionTitle).filter(
+            SectionTitle.section_name == section_name,
+            SectionTitle.is_active == True
+        ).first()
+        return serialize_row(SectionTitleResponse, section_title)
+    return render
+
+def _safe_segment(value: Optional[str]) -> bool:
+    return bool(value) and "/" not in value and not value.startswith(".")
+
+def public_routes(db: Session) -> Dict[str, Tuple[List[str], Renderer]]:
+    """Every exportable public path with the tables it depends on and its renderer."""
+    routes: Dict[str, Tuple[List[str], Renderer]] = {}
+    for key, (model, schema) in SNAPSHOT_COLLECTIONS.items():
+        routes[COLLECTION_PATHS[key]] = ([model.__tablename__], _collection_renderer(model, schema))
+    routes["api/hero"] = ([Hero.__tablename__], _render_hero)
+    routes["api/section-config"] = ([SectionConfig.__tablename__], _render_section_config)
+    routes["api/portfolio"] = (list(PORTFOLIO_TABLES), _render_portfolio)
+
+    categories = db.query(Project.category).filter(Project.is_active == True).distinct().all()
+    for (category,) in categories:
+        if _safe_segment(category):
+            routes[f"api/projects/{category}"] = ([Project.__tablename__], _project_category_renderer(category))
+
+    section_names = db.query(SectionTitle.section_name).filter(SectionTitle.is_active == True).distinct().all()
+    for (section_name,) in section_names:
+        if _safe_segment(section_name):
+            routes[f"api/section-titles/{section_name}"] = ([SectionTitle.__tablename__], _section_title_renderer(section_name))
+    return routes
+
+def table_fingerprints(db: Session, tables: List[str]) -> Dict[str, str]:
+    """Cheap per-table version: row count plus the newest updated_at."""
+    models = {model.__tablename__: model for model, _ in SNAPSHOT_COLLECTIONS.values()}
+    models.update({Hero.__tablename__: Hero, SectionConfig.__tablename__: SectionConfig})
+    fingerprints = {}
+    for table in tables:
+        model = models[table]
+        count, last_updated = db.query(func.count(model.id), func.max(model.updated_at)).one()
+        fingerprints[table] = f"{count}:{last_updated.isoformat() if last_updated else ''}"
+    return fingerprints
+
+def _load_manifest(out_dir: Path) -> dict:
+    try:
+        with open(out_dir / MANIFEST_NAME) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"files": {}, "tables": {}}
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def _remove(path: Path) -> None:
+    for candidate in (path, path.with_name(path.name + ".gz")):
+        if candidate.exists():
+            candidate.unlink()
+
+def export_static_site(out_dir: str, force: bool = False) -> dict:
+    """Render public GET routes to JSON files, re-exporting only those whose tables changed."""
+    out_path = Path(out_dir)
+    manifest = _load_manifest(out_path)
+    previous_files = manifest.get("files", {})
+    previous_tables = manifest.get("tables", {})
+
+    db = SessionLocal()
+    try:
+        routes = public_routes(db)
+        tables = sorted({table for route_tables, _ in routes.values() for table in route_tables})
+        fingerprints = table_fingerprints(db, tables)
+        changed_tables = {table for table in tables if force or previous_tables.get(table) != fingerprints[table]}
+
+        files = {}
+        written, skipped, removed = [], [], []
+        for path, (route_tables, render) in routes.items():
+            file_path = out_path / f"{path}.json"
+            previous = previous_files.get(path)
+            if previous and file_path.exists() and not changed_tables.intersection(route_tables):
+                files[path] = previous
+                skipped.append(path)
+                continue
+
+            content = render(db)
+            if content is None:
+                # Route would 404; make sure no stale file is left behind
+                _remove(file_path)
+                continue
+
+            digest = hashlib.sha256(content).hexdigest()
+            if not (previous and previous.get("sha256") == digest and file_path.exists()):
+                _write_atomic(file_path, content)
+                _write_atomic(file_path.with_name(file_path.name + ".gz"), gzip.compress(content, compresslevel=9, mtime=0))
+                written.append(path)
+            else:
+                skipped.append(path)
+            files[path] = {"sha256": digest, "version": digest[:12], "size": len(content), "tables": route_tables}
+
+        for path in set(previous_files) - set(files):
+            _remove(out_path / f"{path}.json")
+            removed.append(path)
+    finally:
+        db.close()
+
+    manifest = {
+        "generated_at": datetime.utcnow().isoformat(),
+        "tables": fingerprints,
+        "files": files,
+    }
+    _write_atomic(out_path / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return {"written": written, "skipped": skipped, "removed": removed}
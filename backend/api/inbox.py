@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import Response
+from sqlalchemy import and_, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from models.database import Contact, is_sqlite
+from models.models import ContactResponse
+from models.search import fts_query
+from api.cache import response_cache, validator_headers, not_modified
+from api.query import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from api.serialization import json_bytes_response, serialize_rows
+
+# Contact enquiry inbox
+# Newest first with keyset pagination on (created_at, id), served by
+# ix_contacts_created_id. Text search goes through the contacts_fts FTS5
+# index on SQLite and falls back to LIKE elsewhere.
+
+def _search_condition(q: str):
+    if is_sqlite:
+        match = fts_query(q)
+        if match is None:
+            return None
+        return Contact.id.in_(select(text("rowid")).select_from(text("contacts_fts")).where(text("contacts_fts MATCH :match")).params(match=match))
+    pattern = f"%{q}%"
+    return or_(Contact.name.ilike(pattern), Contact.email.ilike(pattern), Contact.message.ilike(pattern))
+
+def _decode_position(cursor: str) -> Tuple[datetime, int]:
+    created_at, row_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@dataclass(frozen=True)
+class InboxParams:
+    limit: Optional[int]
+    cursor: Optional[str]
+    since: Optional[datetime]
+    until: Optional[datetime]
+    email: Optional[str]
+    q: Optional[str]
+
+def inbox_params(
+    limit: Optional[int] = Query(default=None, ge=1, description="Page size; omit for every matching enquiry"),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor value from the previous page"),
+    since: Optional[datetime] = Query(default=None, description="Only enquiries received at or after this time"),
+    until: Optional[datetime] = Query(default=None, description="Only enquiries received before this time"),
+    email: Optional[str] = Query(default=None, description="Only enquiries from this address"),
+    q: Optional[str] = Query(default=None, description="Full-text search over name, email and message"),
+) -> InboxParams:
+    """Query parameters of the contact inbox."""
+    if limit is not None:
+        limit = min(limit, settings.list_max_limit)
+    return InboxParams(limit, cursor, since, until, email.strip() if email else None, q.strip() if q else None)
+
+async def query_inbox(db: AsyncSession, params: InboxParams) -> Tuple[bytes, Optional[str]]:
+    """One page of enquiries, newest first; returns the JSON body and the next cursor."""
+    conditions: List[Any] = []
+    if params.since is not None:
+        conditions.append(Contact.created_at >= params.since)
+    if params.until is not None:
+        conditions.append(Contact.created_at < params.until)
+    if params.email:
+        conditions.append(Contact.email == params.email)
+    if params.q:
+        search = _search_condition(params.q)
+        if search is None:
+            return serialize_rows(ContactResponse, []), None
+        conditions.append(search)
+    if params.cursor:
+        created_at, row_id = _decode_position(params.cursor)
+        conditions.append(or_(
+            Contact.created_at < created_at,
+            and_(Contact.created_at == created_at, Contact.id < row_id),
+        ))
+
+    query = select(Contact).where(*conditions).order_by(Contact.created_at.desc(), Contact.id.desc())
+    if params.limit:
+        query = query.limit(params.limit + 1)
+    contacts = (await db.scalars(query)).all()
+    next_cursor = None
+    if params.limit and len(contacts) > params.limit:
+        contacts = contacts[:params.limit]
+        next_cursor = encode_cursor(contacts[-1].created_at.isoformat(), contacts[-1].id)
+    return serialize_rows(ContactResponse, contacts), next_cursor
+
+async def inbox_response(request: Request, db: AsyncSession, params: InboxParams) -> Response:
+    """Serve a conditional page of the inbox, cached when a page size is given."""
+    tables = (Contact.__tablename__,)
+    headers = validator_headers(tables)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+
+    async def load():
+        return await query_inbox(db, params)
+    if params.limit is None:
+        # An unpaged inbox can be arbitrarily large; don't hold it in the cache
+        body, next_cursor = await load()
+    else:
+        body, next_cursor = await response_cache.get_or_load(("contact_inbox", params), tables, load)
+    if next_cursor:
+        headers = {**headers, NEXT_CURSOR_HEADER: next_cursor}
+    return json_bytes_response(body, headers=headers)
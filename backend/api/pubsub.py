@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import threading
+from typing import Callable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+import orjson
+from models.database import Base
+from models.revisions import add_listener, bump_tables
+
+logger = logging.getLogger(__name__)
+
+# Pub/sub between worker processes
+# WebSocket events are published through a backend so clients connected to
+# any worker receive them. InProcessPubSub delivers within this process only
+# (one worker). SocketPubSub also sends each message to a broker
+# (run_broker, over TCP or a Unix socket) that relays it to every other
+# worker. The same channel carries table change notices so each worker's
+# revisions, response cache and snapshot stay in step with writes made
+# elsewhere.
+#
+# Frames are newline-delimited JSON arrays: [topic, message].
+
+# Internal topic for table change notices; never routed to WebSocket clients
+TABLES_TOPIC = "__tables__"
+
+# Drop outgoing frames rather than buffer without limit when the peer is slow
+MAX_WRITE_BUFFER = 4 * 1024 * 1024
+# Largest frame a reader accepts; a bulk write's change event can be large
+MAX_FRAME = 16 * 1024 * 1024
+
+Deliver = Callable[[str, str], None]
+
+def parse_pubsub_url(url: str) -> Tuple[str, str, Optional[int]]:
+    """Split tcp://host:port or unix:///path into (scheme, host or path, port)."""
+    parsed = urlparse(url)
+    if parsed.scheme == "tcp" and parsed.hostname and parsed.port:
+        return "tcp", parsed.hostname, parsed.port
+    if parsed.scheme == "unix" and parsed.path:
+        return "unix", parsed.path, None
+    raise ValueError(f"Unsupported pub/sub URL: {url!r} (expected tcp://host:port or unix:///path)")
+
+async def _open_connection(url: str):
+    scheme, address, port = parse_pubsub_url(url)
+    if scheme == "unix":
+        return await asyncio.open_unix_connection(address, limit=MAX_FRAME)
+    return await asyncio.open_connection(address, port, limit=MAX_FRAME)
+
+def _frame(topic: str, message: str) -> bytes:
+    return orjson.dumps([topic, message]) + b"\n"
+
+class InProcessPubSub:
+    """Delivers messages to subscribers in this process only."""
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+        self.published = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+    def publish(self, topic: str, message: str) -> None:
+        """Deliver a message locally; call on the event loop."""
+        self.published += 1
+        if self._deliver is not None:
+            self._deliver(topic, message)
+
+    def stats(self) -> dict:
+        return {"backend": "memory", "published": self.published}
+
+class SocketPubSub:
+    """Delivers locally and relays through a broker to the other workers."""
+
+    def __init__(self, url: str, reconnect_seconds: float = 1.0):
+        parse_pubsub_url(url)
+        self.url = url
+        self.reconnect_seconds = reconnect_seconds
+        self._deliver: Optional[Deliver] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._applying_remote = threading.local()
+        self._listening = False
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+        self.reconnects = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run())
+        if not self._listening:
+            add_listener(self._share_table_changes)
+            self._listening = True
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._close_writer()
+        self._deliver = None
+
+    def publish(self, topic: str, message: str) -> None:
+        """Deliver a message locally and send it to the other workers; call on the event loop."""
+        self.published += 1
+        if self._deliver is not None:
+            self._deliver(topic, message)
+        self._send(topic, message)
+
+    def _send(self, topic: str, message: str) -> None:
+        writer = self._writer
+        if writer is None or writer.is_closing() or writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.dropped += 1
+            return
+        writer.write(_frame(topic, message))
+
+    def _share_table_changes(self, tables: Set[str]) -> None:
+        # Runs after every local commit, on whichever thread committed
+        if getattr(self._applying_remote, "active", False) or self._loop is None or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._send, TABLES_TOPIC, orjson.dumps(sorted(tables)).decode())
+
+    def _receive(self, topic: str, message: str) -> None:
+        self.received += 1
+        if topic == TABLES_TOPIC:
+            self._bump_remote(orjson.loads(message))
+        elif self._deliver is not None:
+            self._deliver(topic, message)
+
+    def _bump_remote(self, tables) -> None:
+        # Mark tables changed without echoing the notice back to the broker
+        self._applying_remote.active = True
+        try:
+            bump_tables(tables)
+        finally:
+            self._applying_remote.active = False
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await _open_connection(self.url)
+            except OSError as e:
+                logger.warning("Pub/sub broker %s unavailable (%s); retrying", self.url, e)
+                await asyncio.sleep(self.reconnect_seconds)
+                continue
+            self._writer = writer
+            logger.info("Connected to pub/sub broker %s", self.url)
+            try:
+                async for line in reader:
+                    try:
+                        topic, message = orjson.loads(line)
+                    except (ValueError, TypeError):
+                        logger.warning("Ignoring malformed pub/sub frame")
+                        continue
+                    self._receive(topic, message)
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                logger.warning("Lost pub/sub broker connection: %s", e)
+            finally:
+                self._close_writer()
+            self.reconnects += 1
+            # Writes made elsewhere while disconnected were missed; treat every cached table as stale
+            self._bump_remote(Base.metadata.tables.keys())
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "socket",
+            "url": self.url,
+            "connected": self._writer is not None and not self._writer.is_closing(),
+            "published": self.published,
+            "received": self.received,
+            "dropped": self.dropped,
+            "reconnects": self.reconnects,
+        }
+
+def create_pubsub(url: str):
+    """In-process pub/sub when no broker URL is configured, otherwise the socket backend."""
+    return SocketPubSub(url) if url else InProcessPubSub()
+
+async def run_broker(url: str) -> None:
+    """Relay every frame a worker sends to all other connected workers."""
+    peers: List[asyncio.StreamWriter] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peers.append(writer)
+        logger.info("Worker connected to broker (%d connected)", len(peers))
+        try:
+            async for line in reader:
+                for peer in list(peers):
+                    if peer is writer:
+                        continue
+                    if peer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                        # A worker that cannot keep up reconnects and resyncs its caches
+                        peers.remove(peer)
+                        peer.close()
+                        continue
+                    peer.write(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            if writer in peers:
+                peers.remove(writer)
+            writer.close()
+            logger.info("Worker disconnected from broker (%d connected)", len(peers))
+
+    scheme, address, port = parse_pubsub_url(url)
+    if scheme == "unix":
+        server = await asyncio.start_unix_server(handle, address, limit=MAX_FRAME)
+    else:
+        server = await asyncio.start_server(handle, address, port, limit=MAX_FRAME)
+    logger.info("Pub/sub broker listening on %s", url)
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,172 @@
+import base64
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+import orjson
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import Response
+from sqlalchemy import Boolean, Integer, String, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from models.models import split_list
+from api.cache import response_cache, validator_headers, not_modified
+from api.serialization import dump_json, json_bytes_response, serialize_rows
+
+# Shared list query layer
+# Ordered collection endpoints accept ?limit=&cursor= keyset pagination on
+# (order_index, id), equality filters on short columns (?category=&is_featured=)
+# and ?fields= projections that select only the requested columns. The next
+# page's cursor is returned in the X-Next-Cursor header so the body stays a
+# plain list for existing clients.
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Computed response fields -> (source column, separator)
+COMPUTED_FIELDS = {
+    "technology_list": ("technologies", ","),
+    "achievement_list": ("achievements", "|"),
+    "skill_list": ("skills", ","),
+}
+
+# Query parameters that are never treated as column filters
+RESERVED_PARAMS = {"limit", "cursor", "fields"}
+
+@dataclass(frozen=True)
+class ListParams:
+    limit: Optional[int]
+    cursor: Optional[str]
+    fields: Optional[Tuple[str, ...]]
+
+def list_params(
+    limit: Optional[int] = Query(default=None, ge=1, description="Page size; omit for the full list"),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor value from the previous page"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+) -> ListParams:
+    """Pagination and projection parameters shared by list endpoints."""
+    if limit is not None:
+        limit = min(limit, settings.list_max_limit)
+    return ListParams(limit, cursor, tuple(split_list(fields)) if fields else None)
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque cursor for a keyset position."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def filterable_columns(model) -> Dict[str, Any]:
+    """Columns that can be filtered by equality: booleans, integers and short strings."""
+    columns = {}
+    for column in model.__table__.columns:
+        if isinstance(column.type, (Boolean, Integer)) or (isinstance(column.type, String) and (column.type.length or 0) <= 255):
+            columns[column.key] = column
+    return columns
+
+def _parse_filter(column, raw: str) -> Any:
+    if isinstance(column.type, Boolean):
+        if raw.lower() in ("true", "1"):
+            return True
+        if raw.lower() in ("false", "0"):
+            return False
+    elif isinstance(column.type, Integer):
+        try:
+            return int(raw)
+        except ValueError:
+            pass
+    else:
+        return raw
+    raise HTTPException(status_code=400, detail=f"Invalid value for filter '{column.key}'")
+
+def column_filters(request: Request, model, ignore: Sequence[str] = ()) -> Tuple[Tuple[str, Any], ...]:
+    """Equality filters taken from query parameters that name a filterable column."""
+    columns = filterable_columns(model)
+    filters = []
+    for name, raw in sorted(request.query_params.items()):
+        if name in RESERVED_PARAMS or name in ignore:
+            continue
+        if name in columns:
+            filters.append((name, _parse_filter(columns[name], raw)))
+    return tuple(filters)
+
+def _projection(model, schema, fields: Tuple[str, ...]) -> Tuple[List[str], List[str]]:
+    """Split requested fields into response fields and the columns needed to build them."""
+    allowed = set(schema.model_fields) | set(schema.model_computed_fields)
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    columns = []
+    for field in fields:
+        source = COMPUTED_FIELDS[field][0] if field in COMPUTED_FIELDS else field
+        if source not in columns:
+            columns.append(source)
+    return list(dict.fromkeys(fields)), columns
+
+def _project_row(row, fields: List[str]) -> Dict[str, Any]:
+    item = {}
+    for field in fields:
+        if field in COMPUTED_FIELDS:
+            source, separator = COMPUTED_FIELDS[field]
+            item[field] = split_list(row[source], separator)
+        else:
+            item[field] = row[field]
+    return item
+
+async def query_collection(db: AsyncSession, model, schema, params: ListParams, conditions: Sequence[Any] = (), filters: Sequence[Tuple[str, Any]] = ()) -> Tuple[bytes, Optional[str]]:
+    """Run one keyset page of a list query; returns the JSON body and the next cursor."""
+    conditions = list(conditions) + [getattr(model, name) == value for name, value in filters]
+    if params.cursor:
+        order_index, row_id = decode_cursor(params.cursor, 2)
+        if not isinstance(order_index, int) or not isinstance(row_id, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        conditions.append(or_(
+            model.order_index > order_index,
+            and_(model.order_index == order_index, model.id > row_id),
+        ))
+
+    if params.fields:
+        fields, columns = _projection(model, schema, params.fields)
+        query = select(*[getattr(model, column) for column in columns], model.order_index.label("_order_index"), model.id.label("_id"))
+    else:
+        query = select(model)
+    query = query.where(*conditions).order_by(model.order_index, model.id)
+    if params.limit:
+        query = query.limit(params.limit + 1)
+
+    if params.fields:
+        rows = (await db.execute(query)).mappings().all()
+        keys = [(row["_order_index"], row["_id"]) for row in rows]
+    else:
+        rows = (await db.scalars(query)).all()
+        keys = [(row.order_index, row.id) for row in rows]
+
+    next_cursor = None
+    if params.limit and len(rows) > params.limit:
+        rows, keys = rows[:params.limit], keys[:params.limit]
+        next_cursor = encode_cursor(*keys[-1])
+
+    if params.fields:
+        body = dump_json([_project_row(row, fields) for row in rows])
+    else:
+        body = serialize_rows(schema, rows)
+    return body, next_cursor
+
+async def list_response(request: Request, db: AsyncSession, model, schema, params: ListParams, key: Hashable, conditions: Sequence[Any] = (), ignore: Sequence[str] = ()) -> Response:
+    """Serve a cached, conditional, paginated list of a collection."""
+    tables = (model.__tablename__,)
+    headers = validator_headers(tables)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+
+    filters = column_filters(request, model, ignore)
+    async def load():
+        return await query_collection(db, model, schema, params, conditions, filters)
+    body, next_cursor = await response_cache.get_or_load((key, params, filters), tables, load)
+    if next_cursor:
+        headers = {**headers, NEXT_CURSOR_HEADER: next_cursor}
+    return json_bytes_response(body, headers=headers)
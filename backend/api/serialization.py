@@ -0,0 +1,42 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import orjson
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+# JSON serialization helpers
+# Collections are validated straight from ORM rows and dumped to bytes by
+# pydantic-core in one pass; the resulting bytes are what gets cached and served.
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+@lru_cache(maxsize=None)
+def _item_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+def serialize_rows(schema, rows) -> bytes:
+    """Serialize ORM rows into final JSON bytes using a response schema."""
+    adapter = _list_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+def serialize_row(schema, row) -> Optional[bytes]:
+    """Serialize a single ORM row into JSON bytes, or None if there is no row."""
+    if row is None:
+        return None
+    adapter = _item_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(row, from_attributes=True))
+
+def rows_to_python(schema, rows) -> List[Dict[str, Any]]:
+    """Convert ORM rows into JSON-compatible dicts using a response schema."""
+    adapter = _list_adapter(schema)
+    return adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+
+def dump_json(value: Any) -> bytes:
+    """Encode plain Python data with orjson."""
+    return orjson.dumps(value)
+
+def json_bytes_response(content: bytes, headers: Optional[Dict[str, str]] = None, status_code: int = 200) -> Response:
+    """Serve already-encoded JSON bytes without re-serializing them."""
+    return Response(content=content, status_code=status_code, headers=headers, media_type="application/json")
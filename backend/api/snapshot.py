@@ -0,0 +1,87 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from models.database import ChangeLog, About, Experience, Stat, Testimonial, Project, ContactInfo, Hero, Award, Education, Certification, Skill, SectionConfig, SectionTitle
+from models.models import (
+    AboutResponse, ExperienceResponse, StatResponse, TestimonialResponse, ProjectResponse,
+    ContactInfoResponse, HeroResponse, AwardResponse, EducationResponse, CertificationResponse,
+    SkillResponse, SectionTitleResponse, SectionConfigResponse, DEFAULT_SECTION_CONFIG
+)
+from models.revisions import table_revision
+from api.serialization import dump_json, rows_to_python
+
+# Ordered collections included in the public snapshot: key -> (model, response schema)
+SNAPSHOT_COLLECTIONS = {
+    "about": (About, AboutResponse),
+    "experiences": (Experience, ExperienceResponse),
+    "stats": (Stat, StatResponse),
+    "awards": (Award, AwardResponse),
+    "education": (Education, EducationResponse),
+    "certifications": (Certification, CertificationResponse),
+    "skills": (Skill, SkillResponse),
+    "projects": (Project, ProjectResponse),
+    "testimonials": (Testimonial, TestimonialResponse),
+    "contact_info": (ContactInfo, ContactInfoResponse),
+    "section_titles": (SectionTitle, SectionTitleResponse),
+}
+
+# Every table the snapshot is built from
+PORTFOLIO_TABLES = [Hero.__tablename__, SectionConfig.__tablename__] + [model.__tablename__ for model, _ in SNAPSHOT_COLLECTIONS.values()]
+
+def build_portfolio_document(db: Session) -> Dict[str, Any]:
+    """Query every active public section and serialize it into one document.
+
+    revision is the newest change_log id read in the same transaction, so it
+    can be passed to /api/changes?since= to pick up later edits.
+    """
+    document: Dict[str, Any] = {"revision": db.query(func.max(ChangeLog.id)).scalar() or 0}
+
+    hero = db.query(Hero).filter(Hero.is_active == True).first()
+    document["hero"] = HeroResponse.model_validate(hero).model_dump(mode="json") if hero else None
+
+    for key, (model, schema) in SNAPSHOT_COLLECTIONS.items():
+        rows = db.query(model).filter(model.is_active == True).order_by(model.order_index, model.id).all()
+        document[key] = rows_to_python(schema, rows)
+
+    config = db.query(SectionConfig).first()
+    if config:
+        document["section_config"] = SectionConfigResponse.model_validate(config).model_dump(mode="json")
+    else:
+        now = datetime.utcnow()
+        document["section_config"] = SectionConfigResponse(
+            id=0, config=DEFAULT_SECTION_CONFIG, created_at=now, updated_at=now
+        ).model_dump(mode="json")
+
+    return document
+
+def portfolio_revisions() -> Tuple[int, ...]:
+    """Revisions of the tables the snapshot is built from; writes elsewhere (contacts) leave them unchanged."""
+    return tuple(table_revision(table) for table in PORTFOLIO_TABLES)
+
+class PortfolioSnapshot:
+    """Public portfolio document, encoded once per revision of its tables."""
+
+    def __init__(self):
+        self._document: Optional[bytes] = None
+        self._revisions: Optional[Tuple[int, ...]] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self, db: AsyncSession) -> bytes:
+        """Return the encoded document, rebuilding it only if portfolio content changed since the last build."""
+        revisions = portfolio_revisions()
+        if self._document is not None and self._revisions == revisions:
+            return self._document
+
+        async with self._lock:
+            # Capture the revisions before querying so a concurrent write forces another rebuild
+            revisions = portfolio_revisions()
+            if self._document is None or self._revisions != revisions:
+                document = await db.run_sync(build_portfolio_document)
+                self._document = dump_json(document)
+                self._revisions = revisions
+            return self._document
+
+portfolio_snapshot = PortfolioSnapshot()
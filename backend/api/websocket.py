@@ -0,0 +1,343 @@
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Union
+import orjson
+from fastapi import WebSocket
+from config import settings
+from models.changelog import add_change_listener
+from models.database import SectionConfig
+from api.auth import client_ip
+from api.serialization import dump_json
+from api.pubsub import InProcessPubSub
+from api.snapshot import PORTFOLIO_TABLES
+
+logger = logging.getLogger(__name__)
+
+# WebSocket fan-out
+# Every client gets a bounded send queue drained by its own writer task, so
+# broadcast only enqueues and never waits on a socket. A client whose queue
+# overflows is too slow to keep up and is disconnected rather than allowed to
+# buffer without limit.
+#
+# Committed content changes are published as one "content_changed" event per
+# table per transaction, listing each row's table, id, op, revision and changed fields
+# in the same shape as GET /api/changes, so clients can patch local state.
+# /ws is public, so rows hidden from the site (is_active false) are left out;
+# a row that was just hidden is sent as a delete.
+#
+# Clients only receive topics they subscribe to, by sending
+# {"action": "subscribe" | "unsubscribe", "topics": [...]}. Each content
+# table is a topic, "*" is every topic, and new connections start on
+# DEFAULT_TOPICS so clients that predate subscriptions keep their notices.
+# Topic messages go through a pub/sub backend (api/pubsub.py) that reaches
+# clients held by other workers.
+#
+# A heartbeat task pings every client each ws_ping_interval_seconds and
+# disconnects any that has sent nothing (not even a pong) for
+# ws_idle_timeout_seconds, so half-open sockets do not linger. Connections
+# are capped globally and per client IP.
+
+# Close codes: "try again later" for slow consumers and refused connections, "going away" for idle ones
+SLOW_CONSUMER_CLOSE_CODE = 1013
+IDLE_CLOSE_CODE = 1001
+
+ALL_TOPICS = "*"
+TEST_TOPIC = "test"
+TOPICS = set(PORTFOLIO_TABLES) | {TEST_TOPIC, ALL_TOPICS}
+# Shared by every client until it changes its subscriptions
+DEFAULT_TOPICS = frozenset((SectionConfig.__tablename__, TEST_TOPIC))
+
+PING_MESSAGE = '{"type":"ping"}'
+
+class Client:
+    """One connected socket with its pending messages and writer task."""
+    __slots__ = ("websocket", "ip", "pending", "waiter", "writer", "topics", "last_seen")
+
+    def __init__(self, websocket: WebSocket, ip: str):
+        self.websocket = websocket
+        self.ip = ip
+        self.pending: Deque[str] = deque()
+        # Set only while the writer is waiting for a message
+        self.waiter: Optional[asyncio.Future] = None
+        self.writer: Optional[asyncio.Task] = None
+        self.topics: Union[FrozenSet[str], Set[str]] = DEFAULT_TOPICS
+        self.last_seen = time.monotonic()
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+class ConnectionManager:
+    def __init__(self, queue_size: int, ping_interval: float, idle_timeout: float, max_connections: int, max_connections_per_ip: int):
+        self.queue_size = queue_size
+        self.ping_interval = ping_interval
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.max_connections_per_ip = max_connections_per_ip
+        self.active_connections: Dict[WebSocket, Client] = {}
+        self.connections_per_ip: Dict[str, int] = {}
+        # topic -> clients subscribed to it
+        self.subscribers: Dict[str, Set[Client]] = {}
+        self.messages_sent = 0
+        self.evictions = 0
+        self.send_failures = 0
+        self.idle_disconnects = 0
+        self.rejected = 0
+        self.rejected_per_ip = 0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.backend = InProcessPubSub()
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    async def start(self, backend) -> None:
+        """Bind to the serving loop, start the heartbeat and publish through a pub/sub backend.
+
+        Binding the loop lets commits on worker threads publish to it; the
+        backend lets clients of every worker receive events.
+        """
+        self.loop = asyncio.get_running_loop()
+        self._heartbeat = asyncio.create_task(self._run_heartbeat())
+        self.backend = backend
+        await backend.start(self.deliver)
+
+    async def stop(self) -> None:
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        await self.backend.stop()
+
+    async def connect(self, websocket: WebSocket) -> bool:
+        """Accept a socket unless a connection cap is reached; returns whether it was accepted."""
+        ip = client_ip(websocket) or "unknown"
+        if len(self.active_connections) >= self.max_connections:
+            self.rejected += 1
+        elif self.connections_per_ip.get(ip, 0) >= self.max_connections_per_ip:
+            self.rejected_per_ip += 1
+        else:
+            await websocket.accept()
+            client = Client(websocket, ip)
+            client.writer = asyncio.create_task(self._write(client))
+            self.active_connections[websocket] = client
+            self.connections_per_ip[ip] = self.connections_per_ip.get(ip, 0) + 1
+            self._subscribe(client, DEFAULT_TOPICS)
+            return True
+        # Closing before accept refuses the handshake
+        await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        return False
+
+    def disconnect(self, websocket: WebSocket):
+        client = self.active_connections.pop(websocket, None)
+        if client is None:
+            return
+        remaining = self.connections_per_ip.get(client.ip, 1) - 1
+        if remaining > 0:
+            self.connections_per_ip[client.ip] = remaining
+        else:
+            self.connections_per_ip.pop(client.ip, None)
+        self._unsubscribe(client, list(client.topics))
+        if client.writer is not asyncio.current_task():
+            client.writer.cancel()
+
+    def _subscribe(self, client: Client, topics: Iterable[str]) -> None:
+        topics = set(topics)
+        if client.topics is not DEFAULT_TOPICS or not topics <= DEFAULT_TOPICS:
+            client.topics = set(client.topics) | topics
+        for topic in topics:
+            self.subscribers.setdefault(topic, set()).add(client)
+
+    def _unsubscribe(self, client: Client, topics: Iterable[str]) -> None:
+        topics = set(topics)
+        client.topics = set(client.topics) - topics
+        for topic in topics:
+            subscribers = self.subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self.subscribers[topic]
+
+    def handle_message(self, websocket: WebSocket, data: str) -> None:
+        """Apply a subscribe/unsubscribe request and reply with the client's topics; pongs only mark the client alive."""
+        client = self.active_connections.get(websocket)
+        if client is None:
+            return
+        client.last_seen = time.monotonic()
+        try:
+            request = orjson.loads(data)
+            action, topics = request["action"], request.get("topics")
+        except (ValueError, TypeError, KeyError, AttributeError):
+            action, topics = None, None
+        if action == "pong":
+            return
+        if action not in ("subscribe", "unsubscribe") or not isinstance(topics, list):
+            self._enqueue(client, dump_json({"type": "error", "message": 'Expected {"action": "subscribe" | "unsubscribe", "topics": [...]} or {"action": "pong"}'}).decode())
+            return
+        unknown = [topic for topic in topics if not isinstance(topic, str) or topic not in TOPICS]
+        if unknown:
+            self._enqueue(client, dump_json({"type": "error", "message": "Unknown topics", "topics": unknown}).decode())
+            return
+        if action == "subscribe":
+            self._subscribe(client, topics)
+        else:
+            self._unsubscribe(client, topics)
+        self._enqueue(client, dump_json({"type": "subscribed", "topics": sorted(client.topics)}).decode())
+
+    async def send_personal_message(self, message: str, websocket: WebSocket):
+        client = self.active_connections.get(websocket)
+        if client is not None:
+            self._enqueue(client, message)
+
+    async def broadcast(self, message: str):
+        """Queue a message for every client; never waits on a socket."""
+        self.broadcast_nowait(message)
+
+    def broadcast_nowait(self, message: str) -> None:
+        for client in list(self.active_connections.values()):
+            self._enqueue(client, message)
+
+    def publish(self, topic: str, message: str) -> None:
+        """Publish a message on a topic to subscribers in every worker; call on the event loop."""
+        self.backend.publish(topic, message)
+
+    def deliver(self, topic: str, message: str) -> None:
+        """Queue a message for this worker's clients subscribed to a topic (or to every topic)."""
+        clients = self.subscribers.get(topic, set()) | self.subscribers.get(ALL_TOPICS, set())
+        for client in clients:
+            self._enqueue(client, message)
+
+    def publish_changes(self, entries: List[Dict[str, Any]]) -> None:
+        """Broadcast a commit's change entries; safe to call from any thread."""
+        if self.loop is None or self.loop.is_closed():
+            return
+        by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in filter(None, map(public_entry, entries)):
+            by_table.setdefault(entry["table_name"], []).append(entry)
+        messages = [(table, change_event(table_entries)) for table, table_entries in by_table.items()]
+        if SectionConfig.__tablename__ in by_table:
+            # Older clients refetch the section config on this notice
+            messages.append((SectionConfig.__tablename__, dump_json({
+                "type": "section_config_updated",
+                "message": "Section configuration has been updated",
+                "timestamp": datetime.utcnow().isoformat(),
+            }).decode()))
+        for topic, message in messages:
+            self.loop.call_soon_threadsafe(self.publish, topic, message)
+
+    def _enqueue(self, client: Client, message: str) -> None:
+        if len(client.pending) >= self.queue_size:
+            self._evict(client)
+            return
+        client.pending.append(message)
+        if client.waiter is not None:
+            if not client.waiter.done():
+                client.waiter.set_result(None)
+            client.waiter = None
+
+    def _evict(self, client: Client) -> None:
+        self.evictions += 1
+        logger.info("Evicting slow WebSocket client with %d queued messages", len(client.pending))
+        self.disconnect(client.websocket)
+        asyncio.create_task(self._close(client.websocket, SLOW_CONSUMER_CLOSE_CODE))
+
+    async def _run_heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            deadline = time.monotonic() - self.idle_timeout
+            for client in list(self.active_connections.values()):
+                if client.last_seen < deadline:
+                    self.idle_disconnects += 1
+                    self.disconnect(client.websocket)
+                    asyncio.create_task(self._close(client.websocket, IDLE_CLOSE_CODE))
+                else:
+                    self._enqueue(client, PING_MESSAGE)
+
+    async def _close(self, websocket: WebSocket, code: int) -> None:
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def _write(self, client: Client) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not client.pending:
+                client.waiter = loop.create_future()
+                await client.waiter
+                continue
+            message = client.pending.popleft()
+            try:
+                await client.websocket.send_text(message)
+            except Exception:
+                # The socket is gone; stop writing and forget the client
+                self.send_failures += 1
+                self.disconnect(client.websocket)
+                return
+            self.messages_sent += 1
+
+    def stats(self) -> dict:
+        """Connection, delivery and memory counters for monitoring fan-out."""
+        clients = list(self.active_connections.values())
+        # Shallow size of what each connection allocates here: its state, queue, topics and writer task
+        state_bytes = sum(
+            sys.getsizeof(client) + sys.getsizeof(client.pending) + sys.getsizeof(client.writer)
+            + (sys.getsizeof(client.topics) if client.topics is not DEFAULT_TOPICS else 0)
+            for client in clients
+        )
+        return {
+            "connections": len(self.active_connections),
+            "max_connections": self.max_connections,
+            "client_ips": len(self.connections_per_ip),
+            "max_connections_per_ip": self.max_connections_per_ip,
+            "subscribers": {topic: len(clients) for topic, clients in sorted(self.subscribers.items())},
+            "queued_messages": sum(len(client.pending) for client in clients),
+            "queue_size": self.queue_size,
+            "messages_sent": self.messages_sent,
+            "evictions": self.evictions,
+            "send_failures": self.send_failures,
+            "idle_disconnects": self.idle_disconnects,
+            "rejected": self.rejected,
+            "rejected_per_ip": self.rejected_per_ip,
+            "state_bytes_per_connection": round(state_bytes / len(clients)) if clients else 0,
+            "rss_bytes": _rss_bytes(),
+            "pubsub": self.backend.stats(),
+        }
+
+def public_entry(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The change entry as anonymous clients may see it, or None to withhold it."""
+    if entry.get("visible", True) or entry["op"] == "delete":
+        return entry
+    if entry["op"] == "update" and "is_active" in (entry["changes"] or {}):
+        return {**entry, "op": "delete", "changes": None}
+    return None
+
+def change_event(entries: List[Dict[str, Any]]) -> str:
+    """Encode one commit's change entries for a table as a content_changed event."""
+    return dump_json({
+        "type": "content_changed",
+        "revision": entries[-1]["revision"],
+        "changes": [
+            {
+                "revision": entry["revision"],
+                "table": entry["table_name"],
+                "id": entry["row_id"],
+                "op": entry["op"],
+                "changes": entry["changes"],
+            }
+            for entry in entries
+        ],
+    }).decode()
+
+manager = ConnectionManager(
+    settings.ws_send_queue_size,
+    settings.ws_ping_interval_seconds,
+    settings.ws_idle_timeout_seconds,
+    settings.ws_max_connections,
+    settings.ws_max_connections_per_ip,
+)
+add_change_listener(manager.publish_changes)
@@ -0,0 +1,88 @@
+"""Compare sync and async database request handling under concurrent load.
+
+Mounts two uncached endpoints running the same query, one as a sync handler on
+get_db (threadpool) and one as an async handler on get_async_db, and reports
+latency percentiles for each. Requires httpx.
+
+Usage:
+    python benchmark_db.py [--requests N] [--concurrency C] [--rows R]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from models.database import SessionLocal, Project, async_engine, get_async_db, get_db
+from models.migrations import migrate
+from models.models import ProjectResponse
+from api.serialization import json_bytes_response, serialize_rows
+
+app = FastAPI()
+
+@app.get("/sync")
+def sync_projects(db: Session = Depends(get_db)):
+    projects = db.query(Project).filter(Project.is_active == True).order_by(Project.order_index).all()
+    return json_bytes_response(serialize_rows(ProjectResponse, projects))
+
+@app.get("/async")
+async def async_projects(db: AsyncSession = Depends(get_async_db)):
+    projects = (await db.scalars(select(Project).where(Project.is_active == True).order_by(Project.order_index))).all()
+    return json_bytes_response(serialize_rows(ProjectResponse, projects))
+
+def seed(rows: int) -> None:
+    db = SessionLocal()
+    try:
+        missing = rows - db.query(Project).count()
+        for i in range(max(0, missing)):
+            db.add(Project(title=f"Benchmark {i}", description="Benchmark project", category="benchmark", order_index=i))
+        db.commit()
+    finally:
+        db.close()
+
+async def run(client: httpx.AsyncClient, path: str, requests: int, concurrency: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async database handlers.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent in-flight requests")
+    parser.add_argument("--rows", type=int, default=20, help="Projects to seed")
+    args = parser.parse_args()
+
+    migrate()
+    seed(args.rows)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        # Warm up both connection pools before measuring
+        for path in ("/sync", "/async"):
+            await run(client, path, 50, 5)
+        for path in ("/sync", "/async"):
+            result = await run(client, path, args.requests, args.concurrency)
+            print(f"{path:7} {result['rps']:8.1f} req/s  p50 {result['p50']:6.2f} ms  p95 {result['p95']:6.2f} ms  p99 {result['p99']:6.2f} ms")
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
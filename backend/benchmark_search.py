@@ -0,0 +1,73 @@
+"""Measure /api/search query latency on a large synthetic index.
+
+Seeds the configured database with synthetic projects (indexed by the
+search triggers) until it holds --rows of them, then times search_content
+for a few representative queries, from terms found in a fifth of all
+documents down to rare ones. Point DATABASE_URL at a scratch database.
+
+Usage:
+    python benchmark_search.py [--rows N] [--runs R]
+"""
+import argparse
+import random
+import statistics
+import time
+from models.database import SessionLocal, Project
+from models.migrations import migrate
+from models.search import search_content
+
+WORDS = (
+    "react python kubernetes postgres redis kafka design system dashboard analytics pipeline "
+    "mobile checkout payments search graph realtime streaming vision model training api gateway "
+    "auth cache latency migration observability billing onboarding marketplace chat editor"
+).split()
+# Long tail of rarer words, closer to real prose than the common words alone
+RARE_WORDS = [f"term{i:05d}" for i in range(20000)]
+
+def seed(rows: int) -> None:
+    db = SessionLocal()
+    try:
+        missing = rows - db.query(Project).count()
+        rng = random.Random(42)
+        batch = []
+        for i in range(max(0, missing)):
+            batch.append({
+                "title": " ".join(rng.choices(WORDS, k=3)).title(),
+                "description": " ".join(rng.choices(WORDS, k=8) + rng.choices(RARE_WORDS, k=32)),
+                "technologies": ", ".join(rng.choices(WORDS, k=4)),
+                "category": "benchmark",
+                "order_index": i,
+            })
+            if len(batch) == 5000:
+                db.execute(Project.__table__.insert(), batch)
+                batch = []
+        if batch:
+            db.execute(Project.__table__.insert(), batch)
+        db.commit()
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-text search latency.")
+    parser.add_argument("--rows", type=int, default=100000, help="Projects to index")
+    parser.add_argument("--runs", type=int, default=50, help="Timed runs per query")
+    args = parser.parse_args()
+
+    migrate()
+    seed(args.rows)
+    db = SessionLocal()
+    try:
+        for q in ("kubernetes", "realtime stream", "obs", "payments checkout latency", "term00042", "term0004", "zzzz"):
+            search_content(db, q, 20)
+            timings = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                results = search_content(db, q, 20)
+                timings.append((time.perf_counter() - start) * 1000)
+            timings.sort()
+            print(f"{q!r:30} {len(results):3} results  p50 {statistics.median(timings):7.2f} ms  p95 {timings[int(len(timings) * 0.95) - 1]:7.2f} ms")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
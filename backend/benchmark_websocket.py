@@ -0,0 +1,106 @@
+"""Measure WebSocket broadcast fan-out latency as the number of clients grows.
+
+Connects N in-memory clients (plus one that takes --slow-ms per message) to a
+ConnectionManager and broadcasts a series of messages, reporting how long the
+broadcast call blocks and how long fast clients wait for delivery. The same
+run against a sequential send loop, the previous implementation, shows how a
+single slow client holds up everyone else. Sockets are simulated so the
+numbers isolate the fan-out itself from network and framing costs.
+
+Usage:
+    python benchmark_websocket.py [--clients 10,100,1000,5000] [--messages M] [--slow-ms S]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from api.websocket import ConnectionManager
+
+class FakeSocket:
+    """Stands in for a WebSocket; records when each message arrives."""
+
+    def __init__(self, delay: float = 0.0):
+        self.headers = {}
+        self.client = None
+        self.delay = delay
+        self.latencies = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        else:
+            # A real send yields to the loop while the frame is written
+            await asyncio.sleep(0)
+        self.latencies.append(time.perf_counter() - float(message))
+
+    async def close(self, code: int = 1000):
+        self.closed = True
+
+async def sequential_broadcast(sockets, message: str):
+    for socket in sockets:
+        await socket.send_text(message)
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1000 if values else 0.0
+
+def report(label, clients, block_times, fast):
+    latencies = [latency for socket in fast for latency in socket.latencies]
+    print(
+        f"{label:10} {clients:6} clients  broadcast blocks p50 {statistics.median(block_times) * 1000:8.3f} ms  "
+        f"delivery p50 {percentile(latencies, 0.5):8.3f} ms  p99 {percentile(latencies, 0.99):8.3f} ms"
+    )
+
+async def run(clients: int, messages: int, slow: float, sequential: bool):
+    fast = [FakeSocket() for _ in range(clients)]
+    slow_socket = FakeSocket(slow)
+    sockets = [slow_socket] + fast
+    manager = ConnectionManager(
+        queue_size=messages // 2, ping_interval=60, idle_timeout=60,
+        max_connections=clients + 1, max_connections_per_ip=clients + 1,
+    )
+    if not sequential:
+        for socket in sockets:
+            await manager.connect(socket)
+
+    block_times = []
+    for _ in range(messages):
+        start = time.perf_counter()
+        if sequential:
+            await sequential_broadcast(sockets, repr(start))
+        else:
+            await manager.broadcast(repr(start))
+        block_times.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+    # Let queued deliveries finish before reading latencies
+    while any(len(socket.latencies) < messages for socket in fast):
+        await asyncio.sleep(0.01)
+
+    report("sequential" if sequential else "queued", clients, block_times, fast)
+    if not sequential:
+        stats = manager.stats()
+        print(
+            f"{'':10} slow client evicted: {slow_socket not in manager.active_connections}  "
+            f"evictions {stats['evictions']}  state {stats['state_bytes_per_connection']} B/connection"
+        )
+        for socket in list(manager.active_connections):
+            manager.disconnect(socket)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket broadcast fan-out.")
+    parser.add_argument("--clients", default="10,100,1000,5000", help="Comma-separated client counts")
+    parser.add_argument("--messages", type=int, default=20, help="Messages broadcast per run")
+    parser.add_argument("--slow-ms", type=float, default=200.0, help="Send time of the one slow client")
+    args = parser.parse_args()
+
+    for clients in (int(count) for count in args.clients.split(",")):
+        asyncio.run(run(clients, args.messages, args.slow_ms / 1000, sequential=False))
+    # The sequential loop waits on the slow client every message, so keep it short
+    asyncio.run(run(100, min(args.messages, 5), args.slow_ms / 1000, sequential=True))
+
+if __name__ == "__main__":
+    main()
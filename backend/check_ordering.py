@@ -0,0 +1,55 @@
+"""Check that moves put items where asked, including among tied ranks.
+
+Items created through the API all start at order_index 0, so the common
+case is a move next to an anchor that shares its rank with other rows.
+Runs against a temporary SQLite database and exits non-zero on a wrong
+order.
+
+Usage:
+    python check_ordering.py
+"""
+import os
+import sys
+import tempfile
+
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "check_ordering.db")
+
+from models.database import SessionLocal, Stat
+from models.migrations import migrate
+from models.ordering import move_item
+
+# (starting ranks, moves as (item, before_id, after_id), expected id order)
+CASES = [
+    ([0, 0, 0, 0], [(1, None, 2)], [2, 1, 3, 4]),
+    ([0, 0, 0, 0], [(1, None, 2), (4, 1, None)], [2, 4, 1, 3]),
+    ([0, 0, 0, 0], [(4, 2, None)], [1, 4, 2, 3]),
+    ([0, 0, 0, 0], [(3, None, None)], [1, 2, 4, 3]),
+    ([1, 2, 3], [(3, None, 1)], [1, 3, 2]),
+    ([1024, 1024, 2048], [(3, 2, None)], [1, 3, 2]),
+]
+
+def run(ranks, moves):
+    db = SessionLocal()
+    try:
+        db.query(Stat).delete()
+        db.add_all(Stat(id=i, value=str(i), label=str(i), order_index=rank) for i, rank in enumerate(ranks, 1))
+        db.commit()
+        for item_id, before_id, after_id in moves:
+            move_item(db, Stat, item_id, before_id, after_id)
+            db.commit()
+        return [stat.id for stat in db.query(Stat).order_by(Stat.order_index, Stat.id)]
+    finally:
+        db.close()
+
+def main():
+    migrate()
+    failures = 0
+    for ranks, moves, expected in CASES:
+        order = run(ranks, moves)
+        ok = order == expected
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} ranks {ranks} moves {moves}: {order}" + ("" if ok else f" (expected {expected})"))
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
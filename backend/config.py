@@ -8,14 +8,35 @@ class Settings(BaseSettings):
     
     # Database Configuration
     database_url: str = "sqlite:////data/portfolio.db"
+    async_database_url: str = Field(default="", description="Async driver URL; derived from database_url when empty")
+    db_pool_size: int = Field(default=5, description="Persistent connections kept in the pool")
+    db_max_overflow: int = Field(default=10, description="Extra connections allowed under load")
+    db_pool_timeout: int = Field(default=30, description="Seconds to wait for a free connection")
+    db_pool_recycle: int = Field(default=3600, description="Seconds before a pooled connection is replaced")
+    
+    # SQLite Profile (applied on every connection)
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size: int = Field(default=-8000, description="Negative values are KiB (-8000 = ~8MB)")
+    sqlite_mmap_size: int = Field(default=67108864, description="Bytes of the database file to memory-map")
+    sqlite_temp_store: str = "MEMORY"
     
     # Security Configuration
     secret_key: str = Field(default="", description="Secret key for JWT tokens")
     access_token_expire_minutes: int = 30
+    token_cache_max_entries: int = Field(default=256, description="Verified JWTs kept in memory until they expire")
     
     # Admin Configuration
     admin_username: str = Field(default="admin", description="Admin username")
     admin_password: str = Field(default="", description="Admin password")
+    admin_password_hash: str = Field(default="", description="Pre-computed bcrypt hash of the admin password")
+    bcrypt_rounds: int = Field(default=12, description="bcrypt cost factor for admin password hashes")
+    auth_worker_threads: int = Field(default=1, description="Threads dedicated to password verification")
+    auth_max_pending: int = Field(default=8, description="Queued logins allowed before new ones get 503")
+    login_free_attempts: int = Field(default=5, description="Failed logins allowed per IP/username before backoff")
+    login_backoff_base_seconds: float = 1.0
+    login_backoff_max_seconds: float = 300.0
     
     # Environment Configuration
     environment: str = "development"
@@ -30,6 +51,41 @@ class Settings(BaseSettings):
     upload_dir: str = "uploads"
     max_file_size: int = 5242880  # 5MB in bytes
     
+    # Response Cache Configuration
+    response_cache_max_entries: int = Field(default=256, description="Maximum cached public responses")
+    
+    # Change Feed Configuration
+    change_log_max_entries: int = Field(default=1000, description="Change log entries kept for delta sync")
+    
+    # Ordering Configuration
+    order_rank_gap: int = Field(default=1024, description="Spacing between order_index ranks after a rebalance")
+    order_rank_min_gap: int = Field(default=8, description="Rebalance a collection once a move leaves a smaller gap")
+    
+    # List Query Configuration
+    list_max_limit: int = Field(default=100, description="Largest page size accepted by list endpoints")
+    
+    # Search Configuration
+    search_max_results: int = Field(default=50, description="Maximum results returned by /api/search")
+    
+    # Contact Queue Configuration
+    contact_batch_max_rows: int = Field(default=100, description="Most contact submissions written in one transaction")
+    contact_batch_interval_ms: float = Field(default=5.0, description="How long a batch waits for more submissions before committing")
+    contact_queue_max_depth: int = Field(default=10000, description="Queued submissions beyond which new ones are rejected with 503")
+    
+    # WebSocket Configuration
+    ws_send_queue_size: int = Field(default=64, description="Messages buffered per WebSocket client before it is evicted as too slow")
+    ws_ping_interval_seconds: float = Field(default=25.0, description="How often every WebSocket client is pinged")
+    ws_idle_timeout_seconds: float = Field(default=60.0, description="Disconnect WebSocket clients silent for this long, pongs included")
+    ws_max_connections: int = Field(default=2000, description="WebSocket connections accepted per worker")
+    ws_max_connections_per_ip: int = Field(default=20, description="WebSocket connections accepted per client IP per worker")
+    pubsub_url: str = Field(default="", description="Broker for cross-worker events, tcp://host:port or unix:///path; empty for a single process")
+    
+    # Bulk Operations Configuration
+    bulk_max_items: int = Field(default=500, description="Maximum creates, patches and deletes in one bulk request")
+    
+    # Static Export Configuration
+    static_export_dir: str = Field(default="static_export", description="Directory for prebuilt public API JSON files")
+    
     # Development Configuration
     debug: bool = True
     log_level: str = "INFO"
@@ -0,0 +1,24 @@
+"""Export the public API as static JSON files that a CDN can serve.
+
+Usage:
+    python export_static.py [--out DIR] [--force]
+"""
+import argparse
+from config import settings
+from api.export import export_static_site
+
+def main():
+    parser = argparse.ArgumentParser(description="Export public API responses as static JSON files.")
+    parser.add_argument("--out", default=settings.static_export_dir, help="Output directory")
+    parser.add_argument("--force", action="store_true", help="Re-render every file even if its tables are unchanged")
+    args = parser.parse_args()
+
+    result = export_static_site(args.out, force=args.force)
+    print(f"Exported to {args.out}: {len(result['written'])} written, {len(result['skipped'])} unchanged, {len(result['removed'])} removed")
+    for path in result["written"]:
+        print(f"  + {path}.json")
+    for path in result["removed"]:
+        print(f"  - {path}.json")
+
+if __name__ == "__main__":
+    main()
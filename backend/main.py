@@ -1,9 +1,13 @@
-from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, BackgroundTasks, Depends, HTTPException, Query, Request, status, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
-from models.database import get_db, Contact, About, Experience, Stat, Testimonial, Project, ContactInfo, Hero, Award, Education, Certification, Skill, SectionConfig, SectionTitle
+from pydantic import ValidationError
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.database import get_async_db, async_engine, database_settings_report, is_sqlite, Contact, About, Experience, Stat, Testimonial, Project, ContactInfo, Hero, Award, Education, Certification, Skill, SectionConfig, SectionTitle
 from models.models import (
     ContactForm, ContactResponse,
     AboutCreate, AboutUpdate, AboutResponse,
@@ -13,28 +17,50 @@ from models.models import (
     ProjectCreate, ProjectUpdate, ProjectResponse,
     ContactInfoCreate, ContactInfoUpdate, ContactInfoResponse,
     HeroCreate, HeroUpdate, HeroResponse,
-    OrderUpdate,
+    OrderUpdate, MoveRequest,
     AwardCreate, AwardUpdate, AwardResponse,
     EducationCreate, EducationUpdate, EducationResponse,
     CertificationCreate, CertificationUpdate, CertificationResponse,
     SkillCreate, SkillUpdate, SkillResponse,
-    SectionConfig as SectionConfigModel, SectionConfigResponse,
-    SectionTitleCreate, SectionTitleUpdate, SectionTitleResponse
+    SectionConfig as SectionConfigModel, SectionConfigResponse, DEFAULT_SECTION_CONFIG,
+    SectionTitleCreate, SectionTitleUpdate, SectionTitleResponse,
+    ChangeFeedResponse, BulkRequest, BulkResponse, SearchResult, split_list
 )
-from api.auth import authenticate_user, create_access_token, get_current_active_user, ACCESS_TOKEN_EXPIRE_MINUTES
+from api.auth import authenticate_user_async, client_ip, create_access_token, get_current_active_user, credential_store, login_throttle, token_cache, ACCESS_TOKEN_EXPIRE_MINUTES
 from api.upload import upload_image, upload_multiple_images, delete_image, get_image_info
+from api.snapshot import portfolio_snapshot, PORTFOLIO_TABLES
+from api.export import export_static_site
+from models.changelog import get_changes_since
+from models.migrations import migrate
+from models.bulk import apply_bulk
+from models.ordering import move_item, rebalance_in_background, set_ranks
+from models.search import SEARCH_TABLES, search_content
+from models.tags import tag_slug, tagged_ids
+from api.cache import response_cache, cached_json, validator_headers, not_modified
+from api.contact_queue import contact_queue, QueueFullError
+from api.pubsub import create_pubsub
+from api.websocket import manager, TEST_TOPIC
+from api.inbox import InboxParams, inbox_params, inbox_response
+from api.query import ListParams, list_params, list_response, NEXT_CURSOR_HEADER
+from api.serialization import serialize_row, json_bytes_response, dump_json
 from datetime import datetime, timedelta
 from typing import List, Optional
 from config import settings
 import json
+import logging
+import math
 import os
 from pathlib import Path
 
+logging.basicConfig(level=settings.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("portfolio")
+
 # Create FastAPI app
 app = FastAPI(
     title="Portfolio API",
     description="Backend API for personal portfolio website",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Mount static files for uploaded images
@@ -47,32 +73,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
-# WebSocket connection manager
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
-
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                # Remove disconnected clients
-                self.active_connections.remove(connection)
-
-manager = ConnectionManager()
+@app.on_event("startup")
+def run_database_migrations():
+    """Create missing tables and upgrade the schema before serving requests."""
+    applied = migrate()
+    if applied:
+        logger.info("Applied database migrations: %s", applied)
+
+@app.on_event("startup")
+def load_admin_credentials():
+    """Derive the admin password hash once before serving requests."""
+    credential_store.load()
+
+@app.on_event("startup")
+def report_database_settings():
+    """Log the effective database pool and SQLite settings."""
+    logger.info("Database settings: %s", database_settings_report())
+
+@app.on_event("startup")
+async def start_websocket_events():
+    """Start WebSocket heartbeats and event publishing, connected to the other workers."""
+    await manager.start(create_pubsub(settings.pubsub_url))
+
+@app.on_event("shutdown")
+async def stop_websocket_events():
+    """Stop heartbeats and disconnect from the pub/sub broker."""
+    await manager.stop()
+
+@app.on_event("startup")
+async def start_contact_queue():
+    """Start the writer that group-commits contact submissions."""
+    contact_queue.start()
+
+@app.on_event("shutdown")
+async def drain_contact_queue():
+    """Write every queued contact submission before the database closes."""
+    await contact_queue.stop()
+
+@app.on_event("shutdown")
+async def close_database_connections():
+    """Close pooled async connections so their worker threads exit cleanly."""
+    await async_engine.dispose()
 
 # Health check endpoint
 @app.get("/")
@@ -80,31 +124,84 @@ def read_root():
     """Health check endpoint."""
     return {"message": "Backend is running!", "version": "1.0.0"}
 
+# Portfolio snapshot endpoint
+@app.get("/api/portfolio")
+async def get_portfolio(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Get every active public section in one document, rebuilt only after content changes."""
+    headers = validator_headers(PORTFOLIO_TABLES)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+    return json_bytes_response(await portfolio_snapshot.get(db), headers=headers)
+
+# Change feed endpoint
+@app.get("/api/changes", response_model=ChangeFeedResponse)
+async def get_changes(since: int = 0, limit: int = 500, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
+    """Get content changes after a revision for delta sync (admin only)."""
+    limit = max(1, min(limit, 1000))
+    return await db.run_sync(get_changes_since, since, limit)
+
+# Search endpoints
+async def _search(request: Request, db: AsyncSession, q: str, types: Optional[str], limit: int, include_inactive: bool):
+    if not is_sqlite:
+        raise HTTPException(status_code=501, detail="Search requires the SQLite FTS5 index")
+    tables = split_list(types) if types else []
+    unknown = [table for table in tables if table not in SEARCH_TABLES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown types: {', '.join(unknown)}")
+    limit = max(1, min(limit, settings.search_max_results))
+    async def load():
+        return dump_json(await db.run_sync(search_content, q, limit, tables, include_inactive))
+    key = ("search", q.strip().lower(), tuple(sorted(tables)), limit, include_inactive)
+    return await cached_json(request, key, list(SEARCH_TABLES), load)
+
+@app.get("/api/search", response_model=List[SearchResult])
+async def search(request: Request, q: str = Query(..., min_length=1, max_length=200), types: Optional[str] = None, limit: int = 20, db: AsyncSession = Depends(get_async_db)):
+    """Search active portfolio content, best matches first."""
+    return await _search(request, db, q, types, limit, include_inactive=False)
+
+@app.get("/api/admin/search", response_model=List[SearchResult])
+async def admin_search(request: Request, q: str = Query(..., min_length=1, max_length=200), types: Optional[str] = None, limit: int = 20, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
+    """Search all portfolio content, including inactive items (admin only)."""
+    return await _search(request, db, q, types, limit, include_inactive=True)
+
 # Initialize database endpoint
 @app.post("/api/init-database")
 def init_database_endpoint():
-    """Initialize database tables."""
+    """Initialize database tables and apply pending migrations."""
     try:
-        from models.database import Base, engine
-        Base.metadata.create_all(bind=engine)
+        from models.database import Base
+        applied = migrate()
         return {
             "message": "Database initialized successfully!",
-            "tables_created": list(Base.metadata.tables.keys())
+            "tables_created": list(Base.metadata.tables.keys()),
+            "migrations_applied": applied
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database initialization failed: {str(e)}")
 
 # Authentication endpoints
 @app.post("/api/auth/login")
-async def login(form_data: OAuth2PasswordRequestForm = Depends()):
+async def login(request: Request, form_data: OAuth2PasswordRequestForm = Depends()):
     """User login endpoint."""
-    user = authenticate_user(form_data.username, form_data.password)
+    throttle_keys = login_throttle.keys_for(client_ip(request), form_data.username)
+    retry_after = login_throttle.retry_after(throttle_keys)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts. Please try again later.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    user = await authenticate_user_async(form_data.username, form_data.password)
     if not user:
+        login_throttle.record_failure(throttle_keys)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    login_throttle.record_success(throttle_keys)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user["username"]}, expires_delta=access_token_expires
@@ -176,704 +273,799 @@ async def get_uploaded_image_info(
 
 # Contact endpoints
 @app.post("/api/contact", response_model=ContactResponse)
-def submit_contact(form: ContactForm, db: Session = Depends(get_db)):
+async def submit_contact(form: ContactForm):
     """Submit contact form."""
     try:
-        db_contact = Contact(
-            name=form.name,
-            email=form.email,
-            message=form.message
-        )
-        db.add(db_contact)
-        db.commit()
-        db.refresh(db_contact)
-        return db_contact
+        return await contact_queue.submit(form.name, form.email, form.message)
+    except QueueFullError:
+        raise HTTPException(status_code=503, detail="Contact form is busy, please try again shortly")
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail="Failed to save contact form")
 
 @app.get("/api/contacts", response_model=List[ContactResponse])
-def get_contacts(db: Session = Depends(get_db)):
-    """Get all contact submissions (admin only)."""
-    contacts = db.query(Contact).order_by(Contact.created_at.desc()).all()
-    return contacts
+async def get_contacts(request: Request, inbox: InboxParams = Depends(inbox_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
+    """Get contact submissions, newest first (admin only)."""
+    return await inbox_response(request, db, inbox)
 
 # About endpoints
 @app.get("/api/about", response_model=List[AboutResponse])
-def get_about(db: Session = Depends(get_db)):
+async def get_about(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active about items."""
-    about_items = db.query(About).filter(About.is_active == True).order_by(About.order_index).all()
-    return about_items
+    return await list_response(request, db, About, AboutResponse, page, ("get_about",), [About.is_active == True])
 
 @app.post("/api/about", response_model=AboutResponse)
-def create_about(about: AboutCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_about(about: AboutCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new about item."""
     db_about = About(**about.model_dump())
     db.add(db_about)
-    db.commit()
-    db.refresh(db_about)
+    await db.commit()
+    await db.refresh(db_about)
     return db_about
 
+@app.put("/api/about/order", response_model=List[AboutResponse])
+async def update_about_order(order_updates: List[OrderUpdate], db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
+    """Update about items order."""
+    await db.run_sync(set_ranks, About, [(update.id, update.order_index) for update in order_updates])
+    await db.commit()
+    
+    updated_items = (await db.scalars(select(About).order_by(About.order_index))).all()
+    return updated_items
+
 @app.put("/api/about/{about_id}", response_model=AboutResponse)
-def update_about(about_id: int, about: AboutUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_about(about_id: int, about: AboutUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update about item."""
-    db_about = db.query(About).filter(About.id == about_id).first()
+    db_about = await db.get(About, about_id)
     if not db_about:
         raise HTTPException(status_code=404, detail="About item not found")
     
     for field, value in about.model_dump(exclude_unset=True).items():
         setattr(db_about, field, value)
     
-    db.commit()
-    db.refresh(db_about)
+    await db.commit()
+    await db.refresh(db_about)
     return db_about
 
 @app.delete("/api/about/{about_id}")
-def delete_about(about_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_about(about_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete about item."""
-    db_about = db.query(About).filter(About.id == about_id).first()
+    db_about = await db.get(About, about_id)
     if not db_about:
         raise HTTPException(status_code=404, detail="About item not found")
     
-    db.delete(db_about)
-    db.commit()
+    await db.delete(db_about)
+    await db.commit()
     return {"message": "About item deleted"}
 
-@app.put("/api/about/order", response_model=List[AboutResponse])
-def update_about_order(order_updates: List[OrderUpdate], db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
-    """Update about items order."""
-    for update in order_updates:
-        db_item = db.query(About).filter(About.id == update.id).first()
-        if db_item:
-            db_item.order_index = update.order_index
-    db.commit()
-    
-    updated_items = db.query(About).order_by(About.order_index).all()
-    return updated_items
+# Ordering endpoints
+# Ordered collections by URL segment: segment -> (model, create schema, update schema, response schema)
+ORDERED_COLLECTIONS = {
+    "about": (About, AboutCreate, AboutUpdate, AboutResponse),
+    "experiences": (Experience, ExperienceCreate, ExperienceUpdate, ExperienceResponse),
+    "stats": (Stat, StatCreate, StatUpdate, StatResponse),
+    "testimonials": (Testimonial, TestimonialCreate, TestimonialUpdate, TestimonialResponse),
+    "projects": (Project, ProjectCreate, ProjectUpdate, ProjectResponse),
+    "contact-info": (ContactInfo, ContactInfoCreate, ContactInfoUpdate, ContactInfoResponse),
+    "awards": (Award, AwardCreate, AwardUpdate, AwardResponse),
+    "education": (Education, EducationCreate, EducationUpdate, EducationResponse),
+    "certifications": (Certification, CertificationCreate, CertificationUpdate, CertificationResponse),
+    "skills": (Skill, SkillCreate, SkillUpdate, SkillResponse),
+    "section-titles": (SectionTitle, SectionTitleCreate, SectionTitleUpdate, SectionTitleResponse),
+}
+
+@app.post("/api/{collection}/{item_id}/move")
+async def move_collection_item(collection: str, item_id: int, move: MoveRequest, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
+    """Move an item before or after another item in its collection (admin only)."""
+    if collection not in ORDERED_COLLECTIONS:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    if move.before_id is not None and move.after_id is not None:
+        raise HTTPException(status_code=422, detail="Specify before_id or after_id, not both")
+    model, _, _, schema = ORDERED_COLLECTIONS[collection]
+    try:
+        item, needs_rebalance = await db.run_sync(move_item, model, item_id, move.before_id, move.after_id)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Anchor item not found")
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    await db.commit()
+    await db.refresh(item)
+    if needs_rebalance:
+        background_tasks.add_task(rebalance_in_background, model)
+    return json_bytes_response(serialize_row(schema, item))
+
+# Bulk endpoints
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}" for detail in error.errors())
+
+@app.post("/api/{collection}/bulk", response_model=BulkResponse)
+async def bulk_collection_write(collection: str, bulk: BulkRequest, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
+    """Apply a batch of creates, patches and deletes to a collection in one transaction (admin only).
+
+    Patches and deletes refer to items that existed before the batch.
+    """
+    if collection not in ORDERED_COLLECTIONS:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    if len(bulk.create) + len(bulk.update) + len(bulk.delete) > settings.bulk_max_items:
+        raise HTTPException(status_code=413, detail=f"At most {settings.bulk_max_items} items per batch")
+    model, create_schema, update_schema, schema = ORDERED_COLLECTIONS[collection]
+
+    # Validate every item up front; invalid ones are reported and skipped
+    results: List[dict] = []
+    creates, create_indexes = [], []
+    for index, data in enumerate(bulk.create):
+        try:
+            creates.append(create_schema.model_validate(data).model_dump())
+            create_indexes.append(index)
+        except ValidationError as e:
+            results.append({"op": "create", "index": index, "status": "invalid", "error": _validation_message(e)})
+    updates, update_indexes = [], []
+    for index, data in enumerate(bulk.update):
+        try:
+            item_id = int(data["id"])
+            updates.append((item_id, update_schema.model_validate({k: v for k, v in data.items() if k != "id"}).model_dump(exclude_unset=True)))
+            update_indexes.append(index)
+        except (KeyError, TypeError, ValueError) as e:
+            message = _validation_message(e) if isinstance(e, ValidationError) else "id: a valid integer id is required"
+            results.append({"op": "update", "index": index, "status": "invalid", "error": message})
+
+    try:
+        outcome = await db.run_sync(apply_bulk, model, creates, updates, bulk.delete)
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail=f"Batch rejected: {e.orig}")
+
+    rows = outcome["rows"]
+    def item(row_id):
+        return schema.model_validate(rows[row_id]).model_dump(mode="json") if row_id in rows else None
+
+    for index, row_id in zip(create_indexes, outcome["created"]):
+        results.append({"op": "create", "index": index, "id": row_id, "status": "created", "item": item(row_id)})
+    for index, (row_id, _) in zip(update_indexes, updates):
+        if row_id in outcome["deleted"]:
+            results.append({"op": "update", "index": index, "id": row_id, "status": "deleted"})
+        elif row_id in outcome["existing"]:
+            results.append({"op": "update", "index": index, "id": row_id, "status": "updated", "item": item(row_id)})
+        else:
+            results.append({"op": "update", "index": index, "id": row_id, "status": "not_found", "error": "Item not found"})
+    for index, row_id in enumerate(bulk.delete):
+        status_text = "deleted" if row_id in outcome["deleted"] else "not_found"
+        results.append({"op": "delete", "index": index, "id": row_id, "status": status_text, "error": None if status_text == "deleted" else "Item not found"})
+
+    results.sort(key=lambda result: (("create", "update", "delete").index(result["op"]), result["index"]))
+    return {
+        "created": len(outcome["created"]),
+        "updated": len(outcome["updated"] - outcome["deleted"]),
+        "deleted": len(outcome["deleted"]),
+        "failed": sum(1 for result in results if result["status"] in ("invalid", "not_found")),
+        "results": results,
+    }
 
 # Experience endpoints
 @app.get("/api/experiences", response_model=List[ExperienceResponse])
-def get_experiences(db: Session = Depends(get_db)):
+async def get_experiences(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active experiences."""
-    experiences = db.query(Experience).filter(Experience.is_active == True).order_by(Experience.order_index).all()
-    return experiences
+    return await list_response(request, db, Experience, ExperienceResponse, page, ("get_experiences",), [Experience.is_active == True])
 
 @app.post("/api/experiences", response_model=ExperienceResponse)
-def create_experience(experience: ExperienceCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_experience(experience: ExperienceCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new experience."""
     db_experience = Experience(**experience.model_dump())
     db.add(db_experience)
-    db.commit()
-    db.refresh(db_experience)
+    await db.commit()
+    await db.refresh(db_experience)
     return db_experience
 
 @app.put("/api/experiences/{experience_id}", response_model=ExperienceResponse)
-def update_experience(experience_id: int, experience: ExperienceUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_experience(experience_id: int, experience: ExperienceUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update experience."""
-    db_experience = db.query(Experience).filter(Experience.id == experience_id).first()
+    db_experience = await db.get(Experience, experience_id)
     if not db_experience:
         raise HTTPException(status_code=404, detail="Experience not found")
     
     for field, value in experience.model_dump(exclude_unset=True).items():
         setattr(db_experience, field, value)
     
-    db.commit()
-    db.refresh(db_experience)
+    await db.commit()
+    await db.refresh(db_experience)
     return db_experience
 
 @app.delete("/api/experiences/{experience_id}")
-def delete_experience(experience_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_experience(experience_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete experience."""
-    db_experience = db.query(Experience).filter(Experience.id == experience_id).first()
+    db_experience = await db.get(Experience, experience_id)
     if not db_experience:
         raise HTTPException(status_code=404, detail="Experience not found")
     
-    db.delete(db_experience)
-    db.commit()
+    await db.delete(db_experience)
+    await db.commit()
     return {"message": "Experience deleted"}
 
 # Stats endpoints
 @app.get("/api/stats", response_model=List[StatResponse])
-def get_stats(db: Session = Depends(get_db)):
+async def get_stats(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active stats."""
-    stats = db.query(Stat).filter(Stat.is_active == True).order_by(Stat.order_index).all()
-    return stats
+    return await list_response(request, db, Stat, StatResponse, page, ("get_stats",), [Stat.is_active == True])
 
 @app.post("/api/stats", response_model=StatResponse)
-def create_stat(stat: StatCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_stat(stat: StatCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new stat."""
     db_stat = Stat(**stat.model_dump())
     db.add(db_stat)
-    db.commit()
-    db.refresh(db_stat)
+    await db.commit()
+    await db.refresh(db_stat)
     return db_stat
 
 @app.put("/api/stats/{stat_id}", response_model=StatResponse)
-def update_stat(stat_id: int, stat: StatUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_stat(stat_id: int, stat: StatUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update stat."""
-    db_stat = db.query(Stat).filter(Stat.id == stat_id).first()
+    db_stat = await db.get(Stat, stat_id)
     if not db_stat:
         raise HTTPException(status_code=404, detail="Stat not found")
     
     for field, value in stat.model_dump(exclude_unset=True).items():
         setattr(db_stat, field, value)
     
-    db.commit()
-    db.refresh(db_stat)
+    await db.commit()
+    await db.refresh(db_stat)
     return db_stat
 
 @app.delete("/api/stats/{stat_id}")
-def delete_stat(stat_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_stat(stat_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete stat."""
-    db_stat = db.query(Stat).filter(Stat.id == stat_id).first()
+    db_stat = await db.get(Stat, stat_id)
     if not db_stat:
         raise HTTPException(status_code=404, detail="Stat not found")
     
-    db.delete(db_stat)
-    db.commit()
+    await db.delete(db_stat)
+    await db.commit()
     return {"message": "Stat deleted"}
 
 # Testimonials endpoints
-@app.get("/api/testimonials")
-def get_testimonials(db: Session = Depends(get_db)):
+@app.get("/api/testimonials", response_model=List[TestimonialResponse])
+async def get_testimonials(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active testimonials."""
-    try:
-        testimonials = db.query(Testimonial).filter(Testimonial.is_active == True).order_by(Testimonial.order_index).all()
-        result = []
-        for t in testimonials:
-            result.append({
-                "id": t.id,
-                "name": t.name,
-                "position": t.position,
-                "company": t.company,
-                "relation": t.relation,
-                "message": t.message,
-                "is_active": t.is_active,
-                "order_index": t.order_index,
-                "created_at": t.created_at.isoformat() if t.created_at else None,
-                "updated_at": t.updated_at.isoformat() if t.updated_at else None
-            })
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching testimonials: {str(e)}")
+    return await list_response(request, db, Testimonial, TestimonialResponse, page, ("get_testimonials",), [Testimonial.is_active == True])
 
 @app.post("/api/testimonials", response_model=TestimonialResponse)
-def create_testimonial(testimonial: TestimonialCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_testimonial(testimonial: TestimonialCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new testimonial."""
     db_testimonial = Testimonial(**testimonial.model_dump())
     db.add(db_testimonial)
-    db.commit()
-    db.refresh(db_testimonial)
+    await db.commit()
+    await db.refresh(db_testimonial)
     return db_testimonial
 
 @app.put("/api/testimonials/{testimonial_id}", response_model=TestimonialResponse)
-def update_testimonial(testimonial_id: int, testimonial: TestimonialUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_testimonial(testimonial_id: int, testimonial: TestimonialUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update testimonial."""
-    db_testimonial = db.query(Testimonial).filter(Testimonial.id == testimonial_id).first()
+    db_testimonial = await db.get(Testimonial, testimonial_id)
     if not db_testimonial:
         raise HTTPException(status_code=404, detail="Testimonial not found")
     
     for field, value in testimonial.model_dump(exclude_unset=True).items():
         setattr(db_testimonial, field, value)
     
-    db.commit()
-    db.refresh(db_testimonial)
+    await db.commit()
+    await db.refresh(db_testimonial)
     return db_testimonial
 
 @app.delete("/api/testimonials/{testimonial_id}")
-def delete_testimonial(testimonial_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_testimonial(testimonial_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete testimonial."""
-    db_testimonial = db.query(Testimonial).filter(Testimonial.id == testimonial_id).first()
+    db_testimonial = await db.get(Testimonial, testimonial_id)
     if not db_testimonial:
         raise HTTPException(status_code=404, detail="Testimonial not found")
     
-    db.delete(db_testimonial)
-    db.commit()
+    await db.delete(db_testimonial)
+    await db.commit()
     return {"message": "Testimonial deleted"}
 
 # Projects endpoints
 @app.get("/api/projects", response_model=List[ProjectResponse])
-def get_projects(db: Session = Depends(get_db)):
-    """Get all active projects."""
-    projects = db.query(Project).filter(Project.is_active == True).order_by(Project.order_index).all()
-    return projects
+async def get_projects(request: Request, technology: Optional[str] = None, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
+    """Get all active projects, optionally only those using a technology."""
+    conditions = [Project.is_active == True]
+    if technology:
+        conditions.append(Project.id.in_(tagged_ids(Project.__tablename__, "technologies", technology)))
+    key = ("get_projects", tag_slug(technology)) if technology else ("get_projects",)
+    return await list_response(request, db, Project, ProjectResponse, page, key, conditions, ignore=["technology"])
 
 @app.get("/api/projects/{category}", response_model=List[ProjectResponse])
-def get_projects_by_category(category: str, db: Session = Depends(get_db)):
+async def get_projects_by_category(category: str, request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get projects by category."""
-    projects = db.query(Project).filter(
-        Project.category == category,
-        Project.is_active == True
-    ).order_by(Project.order_index).all()
-    return projects
+    conditions = [Project.category == category, Project.is_active == True]
+    return await list_response(request, db, Project, ProjectResponse, page, ("get_projects_by_category", category), conditions)
 
 @app.post("/api/projects", response_model=ProjectResponse)
-def create_project(project: ProjectCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_project(project: ProjectCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new project."""
     db_project = Project(**project.model_dump())
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
+    await db.commit()
+    await db.refresh(db_project)
     return db_project
 
 @app.put("/api/projects/{project_id}", response_model=ProjectResponse)
-def update_project(project_id: int, project: ProjectUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_project(project_id: int, project: ProjectUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update project."""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
+    db_project = await db.get(Project, project_id)
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     for field, value in project.model_dump(exclude_unset=True).items():
         setattr(db_project, field, value)
     
-    db.commit()
-    db.refresh(db_project)
+    await db.commit()
+    await db.refresh(db_project)
     return db_project
 
 @app.delete("/api/projects/{project_id}")
-def delete_project(project_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_project(project_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete project."""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
+    db_project = await db.get(Project, project_id)
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(db_project)
-    db.commit()
+    await db.delete(db_project)
+    await db.commit()
     return {"message": "Project deleted"}
 
 # Admin endpoints for viewing all data
 # IMPORTANT: DELETE route must come BEFORE GET route to avoid route conflicts
 @app.delete("/api/admin/contacts/{contact_id}")
-def delete_contact_enquiry(contact_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_contact_enquiry(contact_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete a contact enquiry (admin only)."""
-    try:
-        # Debug logging
-        print(f"Attempting to delete contact with ID: {contact_id} (type: {type(contact_id)})")
-        
-        # Query the contact
-        contact = db.query(Contact).filter(Contact.id == contact_id).first()
-        
-        # Debug: Check what contacts exist
-        all_contacts = db.query(Contact).all()
-        print(f"Total contacts in DB: {len(all_contacts)}")
-        if all_contacts:
-            print(f"Existing contact IDs: {[c.id for c in all_contacts]}")
-        
-        if not contact:
-            raise HTTPException(
-                status_code=404, 
-                detail=f"Contact enquiry with ID {contact_id} not found. Available IDs: {[c.id for c in all_contacts] if all_contacts else 'none'}"
-            )
-        
-        db.delete(contact)
-        db.commit()
-        print(f"Successfully deleted contact {contact_id}")
-        return {"message": "Contact enquiry deleted", "success": True}
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        print(f"Error deleting contact: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to delete contact enquiry: {str(e)}")
-
-@app.get("/api/admin/contacts")
-def admin_get_contacts(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
-    """Get all contacts (admin only)."""
-    contacts = db.query(Contact).order_by(Contact.created_at.desc()).all()
-    return contacts
-
-
-@app.get("/api/admin/about")
-def admin_get_about(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+    result = await db.execute(delete(Contact).where(Contact.id == contact_id).execution_options(synchronize_session=False))
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=f"Contact enquiry with ID {contact_id} not found")
+    await db.commit()
+    logger.info("contacts.delete ids=%s deleted=%d user=%s", contact_id, result.rowcount, current_user["username"])
+    return {"message": "Contact enquiry deleted", "success": True, "deleted": result.rowcount}
+
+@app.delete("/api/admin/contacts")
+async def purge_contact_enquiries(
+    ids: Optional[str] = Query(default=None, description="Comma-separated enquiry ids to delete"),
+    older_than: Optional[datetime] = Query(default=None, description="Delete every enquiry received before this time"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_active_user),
+):
+    """Delete several enquiries by id, or every enquiry older than a cutoff, in one statement (admin only)."""
+    if (ids is None) == (older_than is None):
+        raise HTTPException(status_code=422, detail="Specify either ids or older_than")
+    if ids is not None:
+        try:
+            id_list = sorted({int(value) for value in split_list(ids)})
+        except ValueError:
+            raise HTTPException(status_code=422, detail="ids must be comma-separated integers")
+        if not id_list:
+            raise HTTPException(status_code=422, detail="ids must not be empty")
+        condition = Contact.id.in_(id_list)
+    else:
+        condition = Contact.created_at < older_than
+
+    result = await db.execute(delete(Contact).where(condition).execution_options(synchronize_session=False))
+    await db.commit()
+    logger.info(
+        "contacts.purge ids=%s older_than=%s deleted=%d user=%s",
+        ",".join(map(str, id_list)) if ids is not None else "-",
+        older_than.isoformat() if older_than else "-",
+        result.rowcount,
+        current_user["username"],
+    )
+    return {"message": "Contact enquiries deleted", "success": True, "deleted": result.rowcount}
+
+@app.get("/api/admin/contacts", response_model=List[ContactResponse])
+async def admin_get_contacts(request: Request, inbox: InboxParams = Depends(inbox_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
+    """Get contact enquiries, newest first, with date, email and text filters (admin only)."""
+    return await inbox_response(request, db, inbox)
+
+@app.get("/api/admin/cache-stats")
+def admin_get_cache_stats(current_user = Depends(get_current_active_user)):
+    """Get response cache hit/miss counters (admin only)."""
+    return response_cache.stats()
+
+@app.get("/api/admin/auth-stats")
+def admin_get_auth_stats(current_user = Depends(get_current_active_user)):
+    """Get decoded-token cache counters (admin only)."""
+    return token_cache.stats()
+
+@app.get("/api/admin/contact-queue-stats")
+def admin_get_contact_queue_stats(current_user = Depends(get_current_active_user)):
+    """Get contact write queue depth and batch size counters (admin only)."""
+    return contact_queue.stats()
+
+@app.get("/api/admin/websocket-stats")
+def admin_get_websocket_stats(current_user = Depends(get_current_active_user)):
+    """Get WebSocket connection and delivery counters (admin only)."""
+    return manager.stats()
+
+@app.post("/api/admin/export")
+def admin_export_static(background_tasks: BackgroundTasks, force: bool = False, current_user = Depends(get_current_active_user)):
+    """Re-export changed public API responses as static JSON files (admin only)."""
+    background_tasks.add_task(export_static_site, settings.static_export_dir, force)
+    return {"message": "Static export started", "output_dir": settings.static_export_dir}
+
+@app.get("/api/admin/about", response_model=List[AboutResponse])
+async def admin_get_about(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get all about items (admin only)."""
-    about_items = db.query(About).order_by(About.order_index).all()
-    return about_items
+    return await list_response(request, db, About, AboutResponse, page, ("admin_get_about",))
 
-@app.get("/api/admin/experiences")
-def admin_get_experiences(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+@app.get("/api/admin/experiences", response_model=List[ExperienceResponse])
+async def admin_get_experiences(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get all experiences (admin only)."""
-    experiences = db.query(Experience).order_by(Experience.order_index).all()
-    return experiences
+    return await list_response(request, db, Experience, ExperienceResponse, page, ("admin_get_experiences",))
 
-@app.get("/api/admin/stats")
-def admin_get_stats(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+@app.get("/api/admin/stats", response_model=List[StatResponse])
+async def admin_get_stats(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get all stats (admin only)."""
-    stats = db.query(Stat).order_by(Stat.order_index).all()
-    return stats
+    return await list_response(request, db, Stat, StatResponse, page, ("admin_get_stats",))
 
-@app.get("/api/admin/testimonials")
-def admin_get_testimonials(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+@app.get("/api/admin/testimonials", response_model=List[TestimonialResponse])
+async def admin_get_testimonials(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get all testimonials (admin only)."""
-    try:
-        testimonials = db.query(Testimonial).order_by(Testimonial.order_index).all()
-        result = []
-        for t in testimonials:
-            result.append({
-                "id": t.id,
-                "name": t.name,
-                "position": t.position,
-                "company": t.company,
-                "relation": t.relation,
-                "message": t.message,
-                "is_active": t.is_active,
-                "order_index": t.order_index,
-                "created_at": t.created_at.isoformat() if t.created_at else None,
-                "updated_at": t.updated_at.isoformat() if t.updated_at else None
-            })
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching testimonials: {str(e)}")
+    return await list_response(request, db, Testimonial, TestimonialResponse, page, ("admin_get_testimonials",))
 
-@app.get("/api/admin/projects")
-def admin_get_projects(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+@app.get("/api/admin/projects", response_model=List[ProjectResponse])
+async def admin_get_projects(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get all projects (admin only)."""
-    projects = db.query(Project).order_by(Project.order_index).all()
-    return projects
+    return await list_response(request, db, Project, ProjectResponse, page, ("admin_get_projects",))
 
 # Contact info endpoints
 @app.get("/api/contact-info", response_model=List[ContactInfoResponse])
-def get_contact_info(db: Session = Depends(get_db)):
+async def get_contact_info(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active contact info."""
-    contact_info = db.query(ContactInfo).filter(ContactInfo.is_active == True).order_by(ContactInfo.order_index).all()
-    return contact_info
+    return await list_response(request, db, ContactInfo, ContactInfoResponse, page, ("get_contact_info",), [ContactInfo.is_active == True])
 
-@app.get("/api/admin/contact-info")
-def admin_get_contact_info(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+@app.get("/api/admin/contact-info", response_model=List[ContactInfoResponse])
+async def admin_get_contact_info(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get all contact info (admin only)."""
-    contact_info = db.query(ContactInfo).order_by(ContactInfo.order_index).all()
-    return contact_info
+    return await list_response(request, db, ContactInfo, ContactInfoResponse, page, ("admin_get_contact_info",))
 
 @app.post("/api/admin/contact-info", response_model=ContactInfoResponse)
-def create_contact_info(contact_info: ContactInfoCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_contact_info(contact_info: ContactInfoCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new contact info."""
     db_contact_info = ContactInfo(**contact_info.model_dump())
     db.add(db_contact_info)
-    db.commit()
-    db.refresh(db_contact_info)
+    await db.commit()
+    await db.refresh(db_contact_info)
     return db_contact_info
 
 @app.put("/api/admin/contact-info/{contact_info_id}", response_model=ContactInfoResponse)
-def update_contact_info(contact_info_id: int, contact_info: ContactInfoUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_contact_info(contact_info_id: int, contact_info: ContactInfoUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update contact info."""
-    db_contact_info = db.query(ContactInfo).filter(ContactInfo.id == contact_info_id).first()
+    db_contact_info = await db.get(ContactInfo, contact_info_id)
     if not db_contact_info:
         raise HTTPException(status_code=404, detail="Contact info not found")
     
     for field, value in contact_info.model_dump(exclude_unset=True).items():
         setattr(db_contact_info, field, value)
     
-    db.commit()
-    db.refresh(db_contact_info)
+    await db.commit()
+    await db.refresh(db_contact_info)
     return db_contact_info
 
 @app.delete("/api/admin/contact-info/{contact_info_id}")
-def delete_contact_info(contact_info_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_contact_info(contact_info_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete contact info."""
-    db_contact_info = db.query(ContactInfo).filter(ContactInfo.id == contact_info_id).first()
+    db_contact_info = await db.get(ContactInfo, contact_info_id)
     if not db_contact_info:
         raise HTTPException(status_code=404, detail="Contact info not found")
     
-    db.delete(db_contact_info)
-    db.commit()
+    await db.delete(db_contact_info)
+    await db.commit()
     return {"message": "Contact info deleted"}
 
 # Hero endpoints
 @app.get("/api/hero", response_model=HeroResponse)
-def get_hero(db: Session = Depends(get_db)):
+async def get_hero(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get active hero content."""
-    hero = db.query(Hero).filter(Hero.is_active == True).first()
+    headers = validator_headers([Hero.__tablename__])
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+    async def load():
+        hero = (await db.scalars(select(Hero).where(Hero.is_active == True).limit(1))).first()
+        return serialize_row(HeroResponse, hero)
+    hero = await response_cache.get_or_load(("get_hero",), [Hero.__tablename__], load)
     if not hero:
         raise HTTPException(status_code=404, detail="Hero content not found")
-    return hero
+    return json_bytes_response(hero, headers=headers)
 
 @app.post("/api/hero", response_model=HeroResponse)
-def create_hero(hero: HeroCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_hero(hero: HeroCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new hero content."""
     # Deactivate any existing active hero
-    existing_hero = db.query(Hero).filter(Hero.is_active == True).first()
+    existing_hero = (await db.scalars(select(Hero).where(Hero.is_active == True).limit(1))).first()
     if existing_hero:
         existing_hero.is_active = False
-        db.commit()
+        await db.commit()
     
     db_hero = Hero(**hero.model_dump())
     db.add(db_hero)
-    db.commit()
-    db.refresh(db_hero)
+    await db.commit()
+    await db.refresh(db_hero)
     return db_hero
 
 @app.put("/api/hero/{hero_id}", response_model=HeroResponse)
-def update_hero(hero_id: int, hero: HeroUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_hero(hero_id: int, hero: HeroUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update hero content."""
-    db_hero = db.query(Hero).filter(Hero.id == hero_id).first()
+    db_hero = await db.get(Hero, hero_id)
     if not db_hero:
         raise HTTPException(status_code=404, detail="Hero content not found")
     
     for field, value in hero.model_dump(exclude_unset=True).items():
         setattr(db_hero, field, value)
     
-    db.commit()
-    db.refresh(db_hero)
+    await db.commit()
+    await db.refresh(db_hero)
     return db_hero
 
 @app.delete("/api/hero/{hero_id}")
-def delete_hero(hero_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_hero(hero_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete hero content."""
-    db_hero = db.query(Hero).filter(Hero.id == hero_id).first()
+    db_hero = await db.get(Hero, hero_id)
     if not db_hero:
         raise HTTPException(status_code=404, detail="Hero content not found")
     
-    db.delete(db_hero)
-    db.commit()
+    await db.delete(db_hero)
+    await db.commit()
     return {"message": "Hero content deleted"}
 
-@app.get("/api/admin/hero")
-def admin_get_hero(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+@app.get("/api/admin/hero", response_model=HeroResponse)
+async def admin_get_hero(db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get active hero content (admin only)."""
-    hero = db.query(Hero).filter(Hero.is_active == True).first()
+    async def load():
+        hero = (await db.scalars(select(Hero).where(Hero.is_active == True).limit(1))).first()
+        return serialize_row(HeroResponse, hero)
+    hero = await response_cache.get_or_load(("get_hero",), [Hero.__tablename__], load)
     if not hero:
         raise HTTPException(status_code=404, detail="Hero content not found")
-    return hero
+    return json_bytes_response(hero)
 
 # Awards endpoints
 @app.get("/api/awards", response_model=List[AwardResponse])
-def get_awards(db: Session = Depends(get_db)):
+async def get_awards(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active awards."""
-    awards = db.query(Award).filter(Award.is_active == True).order_by(Award.order_index).all()
-    return awards
+    return await list_response(request, db, Award, AwardResponse, page, ("get_awards",), [Award.is_active == True])
 
 @app.post("/api/awards", response_model=AwardResponse)
-def create_award(award: AwardCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_award(award: AwardCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new award."""
     db_award = Award(**award.model_dump())
     db.add(db_award)
-    db.commit()
-    db.refresh(db_award)
+    await db.commit()
+    await db.refresh(db_award)
     return db_award
 
 @app.put("/api/awards/{award_id}", response_model=AwardResponse)
-def update_award(award_id: int, award: AwardUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_award(award_id: int, award: AwardUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update award."""
-    db_award = db.query(Award).filter(Award.id == award_id).first()
+    db_award = await db.get(Award, award_id)
     if not db_award:
         raise HTTPException(status_code=404, detail="Award not found")
     
     for field, value in award.model_dump(exclude_unset=True).items():
         setattr(db_award, field, value)
     
-    db.commit()
-    db.refresh(db_award)
+    await db.commit()
+    await db.refresh(db_award)
     return db_award
 
 @app.delete("/api/awards/{award_id}")
-def delete_award(award_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_award(award_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete award."""
-    db_award = db.query(Award).filter(Award.id == award_id).first()
+    db_award = await db.get(Award, award_id)
     if not db_award:
         raise HTTPException(status_code=404, detail="Award not found")
     
-    db.delete(db_award)
-    db.commit()
+    await db.delete(db_award)
+    await db.commit()
     return {"message": "Award deleted"}
 
 # Education endpoints
 @app.get("/api/education", response_model=List[EducationResponse])
-def get_education(db: Session = Depends(get_db)):
+async def get_education(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active education."""
-    education = db.query(Education).filter(Education.is_active == True).order_by(Education.order_index).all()
-    return education
+    return await list_response(request, db, Education, EducationResponse, page, ("get_education",), [Education.is_active == True])
 
 @app.post("/api/education", response_model=EducationResponse)
-def create_education(education: EducationCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_education(education: EducationCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new education."""
     db_education = Education(**education.model_dump())
     db.add(db_education)
-    db.commit()
-    db.refresh(db_education)
+    await db.commit()
+    await db.refresh(db_education)
     return db_education
 
 @app.put("/api/education/{education_id}", response_model=EducationResponse)
-def update_education(education_id: int, education: EducationUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_education(education_id: int, education: EducationUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update education."""
-    db_education = db.query(Education).filter(Education.id == education_id).first()
+    db_education = await db.get(Education, education_id)
     if not db_education:
         raise HTTPException(status_code=404, detail="Education not found")
     
     for field, value in education.model_dump(exclude_unset=True).items():
         setattr(db_education, field, value)
     
-    db.commit()
-    db.refresh(db_education)
+    await db.commit()
+    await db.refresh(db_education)
     return db_education
 
 @app.delete("/api/education/{education_id}")
-def delete_education(education_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_education(education_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete education."""
-    db_education = db.query(Education).filter(Education.id == education_id).first()
+    db_education = await db.get(Education, education_id)
     if not db_education:
         raise HTTPException(status_code=404, detail="Education not found")
     
-    db.delete(db_education)
-    db.commit()
+    await db.delete(db_education)
+    await db.commit()
     return {"message": "Education deleted"}
 
 # Certifications endpoints
 @app.get("/api/certifications", response_model=List[CertificationResponse])
-def get_certifications(db: Session = Depends(get_db)):
+async def get_certifications(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active certifications."""
-    certifications = db.query(Certification).filter(Certification.is_active == True).order_by(Certification.order_index).all()
-    return certifications
+    return await list_response(request, db, Certification, CertificationResponse, page, ("get_certifications",), [Certification.is_active == True])
 
 @app.post("/api/certifications", response_model=CertificationResponse)
-def create_certification(certification: CertificationCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_certification(certification: CertificationCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new certification."""
     db_certification = Certification(**certification.model_dump())
     db.add(db_certification)
-    db.commit()
-    db.refresh(db_certification)
+    await db.commit()
+    await db.refresh(db_certification)
     return db_certification
 
 @app.put("/api/certifications/{certification_id}", response_model=CertificationResponse)
-def update_certification(certification_id: int, certification: CertificationUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_certification(certification_id: int, certification: CertificationUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update certification."""
-    db_certification = db.query(Certification).filter(Certification.id == certification_id).first()
+    db_certification = await db.get(Certification, certification_id)
     if not db_certification:
         raise HTTPException(status_code=404, detail="Certification not found")
     
     for field, value in certification.model_dump(exclude_unset=True).items():
         setattr(db_certification, field, value)
     
-    db.commit()
-    db.refresh(db_certification)
+    await db.commit()
+    await db.refresh(db_certification)
     return db_certification
 
 @app.delete("/api/certifications/{certification_id}")
-def delete_certification(certification_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_certification(certification_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete certification."""
-    db_certification = db.query(Certification).filter(Certification.id == certification_id).first()
+    db_certification = await db.get(Certification, certification_id)
     if not db_certification:
         raise HTTPException(status_code=404, detail="Certification not found")
     
-    db.delete(db_certification)
-    db.commit()
+    await db.delete(db_certification)
+    await db.commit()
     return {"message": "Certification deleted"}
 
 # Skills endpoints
 @app.get("/api/skills", response_model=List[SkillResponse])
-def get_skills(db: Session = Depends(get_db)):
+async def get_skills(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get active skills."""
-    skills = db.query(Skill).filter(Skill.is_active == True).order_by(Skill.order_index).all()
-    return skills
+    return await list_response(request, db, Skill, SkillResponse, page, ("get_skills",), [Skill.is_active == True])
 
 @app.post("/api/skills", response_model=SkillResponse)
-def create_skill(skill: SkillCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_skill(skill: SkillCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new skill."""
     db_skill = Skill(**skill.model_dump())
     db.add(db_skill)
-    db.commit()
-    db.refresh(db_skill)
+    await db.commit()
+    await db.refresh(db_skill)
     return db_skill
 
 @app.put("/api/skills/{skill_id}", response_model=SkillResponse)
-def update_skill(skill_id: int, skill: SkillUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_skill(skill_id: int, skill: SkillUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update skill."""
-    db_skill = db.query(Skill).filter(Skill.id == skill_id).first()
+    db_skill = await db.get(Skill, skill_id)
     if not db_skill:
         raise HTTPException(status_code=404, detail="Skill not found")
     
     for field, value in skill.model_dump(exclude_unset=True).items():
         setattr(db_skill, field, value)
     
-    db.commit()
-    db.refresh(db_skill)
+    await db.commit()
+    await db.refresh(db_skill)
     return db_skill
 
 @app.delete("/api/skills/{skill_id}")
-def delete_skill(skill_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_skill(skill_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete skill."""
-    db_skill = db.query(Skill).filter(Skill.id == skill_id).first()
+    db_skill = await db.get(Skill, skill_id)
     if not db_skill:
         raise HTTPException(status_code=404, detail="Skill not found")
     
-    db.delete(db_skill)
-    db.commit()
+    await db.delete(db_skill)
+    await db.commit()
     return {"message": "Skill deleted"}
 
 # Section titles endpoints (new structure)
 @app.get("/api/section-titles", response_model=List[SectionTitleResponse])
-def get_section_titles(db: Session = Depends(get_db)):
+async def get_section_titles(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db)):
     """Get all active section titles."""
-    section_titles = db.query(SectionTitle).filter(SectionTitle.is_active == True).order_by(SectionTitle.order_index).all()
-    return section_titles
+    return await list_response(request, db, SectionTitle, SectionTitleResponse, page, ("get_section_titles",), [SectionTitle.is_active == True])
 
 @app.get("/api/section-titles/{section_name}", response_model=SectionTitleResponse)
-def get_section_title(section_name: str, db: Session = Depends(get_db)):
+async def get_section_title(section_name: str, request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get section title by section name."""
-    section_title = db.query(SectionTitle).filter(
-        SectionTitle.section_name == section_name,
-        SectionTitle.is_active == True
-    ).first()
+    headers = validator_headers([SectionTitle.__tablename__])
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+    async def load():
+        section_title = (await db.scalars(select(SectionTitle).where(
+            SectionTitle.section_name == section_name,
+            SectionTitle.is_active == True
+        ).limit(1))).first()
+        return serialize_row(SectionTitleResponse, section_title)
+    section_title = await response_cache.get_or_load(("get_section_title", section_name), [SectionTitle.__tablename__], load)
     if not section_title:
         raise HTTPException(status_code=404, detail="Section title not found")
-    return section_title
+    return json_bytes_response(section_title, headers=headers)
 
 @app.post("/api/section-titles", response_model=SectionTitleResponse)
-def create_section_title(section_title: SectionTitleCreate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_section_title(section_title: SectionTitleCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create new section title."""
     db_section_title = SectionTitle(**section_title.model_dump())
     db.add(db_section_title)
-    db.commit()
-    db.refresh(db_section_title)
+    await db.commit()
+    await db.refresh(db_section_title)
     return db_section_title
 
 @app.put("/api/section-titles/{section_title_id}", response_model=SectionTitleResponse)
-def update_section_title(section_title_id: int, section_title: SectionTitleUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def update_section_title(section_title_id: int, section_title: SectionTitleUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Update section title."""
-    db_section_title = db.query(SectionTitle).filter(SectionTitle.id == section_title_id).first()
+    db_section_title = await db.get(SectionTitle, section_title_id)
     if not db_section_title:
         raise HTTPException(status_code=404, detail="Section title not found")
     
     for field, value in section_title.model_dump(exclude_unset=True).items():
         setattr(db_section_title, field, value)
     
-    db.commit()
-    db.refresh(db_section_title)
+    await db.commit()
+    await db.refresh(db_section_title)
     return db_section_title
 
 @app.delete("/api/section-titles/{section_title_id}")
-def delete_section_title(section_title_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def delete_section_title(section_title_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Delete section title."""
-    db_section_title = db.query(SectionTitle).filter(SectionTitle.id == section_title_id).first()
+    db_section_title = await db.get(SectionTitle, section_title_id)
     if not db_section_title:
         raise HTTPException(status_code=404, detail="Section title not found")
     
-    db.delete(db_section_title)
-    db.commit()
+    await db.delete(db_section_title)
+    await db.commit()
     return {"message": "Section title deleted"}
 
-@app.get("/api/admin/section-titles")
-def admin_get_section_titles(db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+@app.get("/api/admin/section-titles", response_model=List[SectionTitleResponse])
+async def admin_get_section_titles(request: Request, page: ListParams = Depends(list_params), db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Get all section titles (admin only)."""
-    section_titles = db.query(SectionTitle).order_by(SectionTitle.order_index).all()
-    return section_titles
+    return await list_response(request, db, SectionTitle, SectionTitleResponse, page, ("admin_get_section_titles",))
 
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    await manager.connect(websocket)
+    if not await manager.connect(websocket):
+        return
     try:
         while True:
-            # Keep connection alive
+            # Subscribe/unsubscribe requests and pongs; replies go through the client's send queue
             data = await websocket.receive_text()
-            # Echo back for testing (optional)
-            await manager.send_personal_message(f"Message received: {data}", websocket)
+            manager.handle_message(websocket, data)
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 # Test endpoint to broadcast a test message
 @app.post("/api/test-websocket")
 async def test_websocket():
     """Test WebSocket broadcast functionality."""
-    await manager.broadcast(json.dumps({
+    manager.publish(TEST_TOPIC, json.dumps({
         "type": "test",
         "message": "This is a test WebSocket message",
         "timestamp": datetime.utcnow().isoformat()
@@ -882,124 +1074,40 @@ async def test_websocket():
 
 # Section configuration endpoints
 @app.get("/api/section-config", response_model=SectionConfigResponse)
-def get_section_config(db: Session = Depends(get_db)):
+async def get_section_config(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get section configuration."""
-    config = db.query(SectionConfig).first()
-    if not config:
-        # Return comprehensive default configuration that matches frontend expectations
-        default_config = {
-            "hero": {
-                "title": "I Am Rahul Raj",
-                "subtitle": "AVP Product",
-                "description": "Software Alchemist crafting digital experiences that users love & businesses value",
-                "badge": "Welcome to My Universe",
-                "badgeEmoji": "✨"
-            },
-            "about": {
-                "title": "Get to Know Me",
-                "description": "A glimpse into my world of innovation and creativity",
-                "whoIAm": {
-                    "title": "Who I Am",
-                    "description": "Product manager with designer's heart, diplomat's tongue & engineer's brain"
-                },
-                "whatIDo": {
-                    "title": "What I Do",
-                    "description": "Craft digital experiences that users love & businesses value"
-                },
-                "whatInterestsMe": {
-                    "title": "What Interests Me",
-                    "description": "Emerging tech, AI possibilities & real-world impact solutions"
-                }
-            },
-            "stats": {
-                "title": "My Journey",
-                "mainTitle": "Achievements & Skills",
-                "description": "A glimpse into my professional journey and expertise"
-            },
-            "projects": {
-                "title": "My Creations",
-                "mainTitle": "Amazing Projects",
-                "description": "Check out some of my favorite projects and creations! 🚀"
-            },
-            "experience": {
-                "title": "My Journey",
-                "mainTitle": "My Adventure So Far",
-                "description": "A colorful journey through the world of product management and innovation! 🌈"
-            },
-            "testimonials": {
-                "title": "What People Say",
-                "mainTitle": "Lovely Testimonials",
-                "description": "Hear what amazing people have to say about working with me! 💬"
-            },
-            "contact": {
-                "title": "Get In Touch",
-                "mainTitle": "Let's Connect",
-                "description": "Ready to work together? Let's create something amazing! 🚀"
-            },
-            "thankYou": {
-                "title": "Thank You",
-                "mainTitle": "Thanks for Reaching Out!",
-                "description": "I'll get back to you as soon as possible. In the meantime, feel free to explore more of my work!",
-                "emoji": "🎉"
-            },
-            "awards": {
-                "title": "Awards",
-                "description": "My awards and recognition"
-            },
-            "education": {
-                "title": "Education",
-                "description": "My educational background"
-            },
-            "certifications": {
-                "title": "Certifications",
-                "description": "My certifications"
-            },
-            "skills": {
-                "title": "Skills",
-                "description": "My technical skills"
-            }
-        }
-        return SectionConfigResponse(
-            id=0,
-            config=default_config,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-    return config
+    async def load():
+        config = (await db.scalars(select(SectionConfig).limit(1))).first()
+        if not config:
+            # Return comprehensive default configuration that matches frontend expectations
+            config = SectionConfigResponse(
+                id=0,
+                config=DEFAULT_SECTION_CONFIG,
+                created_at=datetime.utcnow(),
+                updated_at=datetime.utcnow()
+            )
+        return serialize_row(SectionConfigResponse, config)
+    return await cached_json(request, ("get_section_config",), [SectionConfig.__tablename__], load)
 
 @app.post("/api/section-config", response_model=SectionConfigResponse)
-async def create_section_config(config_data: SectionConfigModel, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
+async def create_section_config(config_data: SectionConfigModel, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_active_user)):
     """Create or update section configuration."""
-    existing_config = db.query(SectionConfig).first()
+    existing_config = (await db.scalars(select(SectionConfig).limit(1))).first()
     
     if existing_config:
         # Update existing config
         existing_config.config = config_data.config
         existing_config.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(existing_config)
-        
-        # Broadcast the update to all connected WebSocket clients
-        await manager.broadcast(json.dumps({
-            "type": "section_config_updated",
-            "message": "Section configuration has been updated",
-            "timestamp": datetime.utcnow().isoformat()
-        }))
+        await db.commit()
+        await db.refresh(existing_config)
         
         return existing_config
     else:
         # Create new config
         db_config = SectionConfig(config=config_data.config)
         db.add(db_config)
-        db.commit()
-        db.refresh(db_config)
-        
-        # Broadcast the update to all connected WebSocket clients
-        await manager.broadcast(json.dumps({
-            "type": "section_config_updated",
-            "message": "Section configuration has been created",
-            "timestamp": datetime.utcnow().isoformat()
-        }))
+        await db.commit()
+        await db.refresh(db_config)
         
         return db_config
 
@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import bindparam, delete, insert, select
+from sqlalchemy.orm import Session
+from models.changelog import change_entry, record_changes
+from models.tags import TAGGED_TABLES, remove_item_tags, replace_tags, tag_values
+
+# Set-based bulk writes
+# A batch of creates, patches and deletes for one model is applied with one
+# multi-row INSERT ... RETURNING, one executemany UPDATE per distinct field set
+# and one DELETE ... WHERE id IN (...), all in the caller's transaction.
+
+def apply_bulk(db: Session, model, creates: List[Dict[str, Any]], updates: List[Tuple[int, Dict[str, Any]]], deletes: List[int]) -> Dict[str, Any]:
+    """Apply validated writes; returns created ids (in request order), the ids updated and deleted, and the written rows.
+
+    The caller commits.
+    """
+    table = model.__table__
+    now = datetime.utcnow()
+    update_ids = {row_id for row_id, _ in updates}
+    existing = set(db.scalars(select(model.id).where(model.id.in_(update_ids | set(deletes))))) if update_ids or deletes else set()
+
+    created_ids: List[int] = []
+    if creates:
+        rows = [{**values, "created_at": now, "updated_at": now} for values in creates]
+        created_ids = list(db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows))
+
+    # Group patches by the fields they set so each group is one executemany
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    updated_ids = set()
+    for row_id, values in updates:
+        if row_id not in existing or not values:
+            continue
+        fields = tuple(sorted(values))
+        groups.setdefault(fields, []).append({"row_id": row_id, **{f"v_{field}": values[field] for field in fields}})
+        updated_ids.add(row_id)
+    for fields, params in groups.items():
+        db.execute(
+            table.update()
+            .where(table.c.id == bindparam("row_id"))
+            .values(updated_at=now, **{field: bindparam(f"v_{field}") for field in fields}),
+            params,
+        )
+
+    deleted_ids = [row_id for row_id in dict.fromkeys(deletes) if row_id in existing]
+    if deleted_ids:
+        db.execute(delete(model).where(model.id.in_(deleted_ids)))
+
+    # Load what we wrote in one query, for the change log and the response
+    written_ids = (set(created_ids) | updated_ids) - set(deleted_ids)
+    rows = {row.id: row for row in db.scalars(select(model).where(model.id.in_(written_ids)).execution_options(populate_existing=True))} if written_ids else {}
+
+    # Keep item_tags in step with the list columns, which these statements bypass
+    if model.__tablename__ in TAGGED_TABLES:
+        connection = db.connection()
+        values = [value for row_id in created_ids for value in tag_values(rows[row_id])]
+        values.extend(
+            value for row_id, fields in updates if row_id in rows and row_id in updated_ids
+            for value in tag_values(rows[row_id], fields)
+        )
+        replace_tags(connection, model.__tablename__, values)
+        if deleted_ids:
+            remove_item_tags(connection, model.__tablename__, deleted_ids)
+
+    entries = [change_entry(rows[row_id], "create") for row_id in created_ids if row_id in rows]
+    entries.extend(
+        change_entry(rows[row_id], "update", list(values) + ["updated_at"])
+        for row_id, values in updates if row_id in rows and row_id in updated_ids and row_id not in created_ids
+    )
+    entries.extend({"table_name": model.__tablename__, "row_id": row_id, "op": "delete", "changes": None} for row_id in deleted_ids)
+    record_changes(db, entries)
+
+    return {"created": created_ids, "updated": updated_ids, "deleted": set(deleted_ids), "existing": existing, "rows": rows}
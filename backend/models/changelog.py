@@ -0,0 +1,117 @@
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+from config import settings
+from models.database import SessionLocal, ChangeLog
+
+# Change log recording
+# Every flushed ORM write appends one compact entry (table, id, op, changed
+# fields) to change_log inside the same transaction, so the log's id is a
+# monotonically increasing global content revision that clients can sync from.
+# Once the transaction commits, its entries are handed to change listeners
+# (the WebSocket broadcaster) tagged with their revision and with whether the
+# row is visible on the public site; the visibility flag is not stored.
+
+# Tables that are not part of the content feed
+EXCLUDED_TABLES = {ChangeLog.__tablename__, "contacts"}
+
+_change_listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def _column_values(obj, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    mapper = inspect(obj).mapper
+    values = {}
+    for attr in mapper.column_attrs:
+        if only is None or attr.key in only:
+            values[attr.key] = _json_value(getattr(obj, attr.key))
+    return values
+
+def _changed_fields(obj) -> List[str]:
+    state = inspect(obj)
+    return [attr.key for attr in state.mapper.column_attrs if state.attrs[attr.key].history.has_changes()]
+
+def change_entry(obj, op: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build a change entry for an ORM object; deletes carry no values."""
+    visible = bool(getattr(obj, "is_active", True))
+    if fields and "is_active" in fields and visible:
+        # A row coming back into view needs all of its values, not just the flag
+        fields = None
+    changes = None if op == "delete" else _column_values(obj, fields)
+    return {"table_name": obj.__tablename__, "row_id": obj.id, "op": op, "changes": changes, "visible": visible}
+
+def record_changes(session: Session, entries: List[Dict[str, Any]]) -> None:
+    """Append change entries (table_name, row_id, op, changes, optional visible) and compact the log."""
+    entries = [entry for entry in entries if entry["table_name"] not in EXCLUDED_TABLES]
+    if not entries:
+        return
+    now = datetime.utcnow()
+    connection = session.connection()
+    revisions = connection.execute(
+        ChangeLog.__table__.insert().returning(ChangeLog.__table__.c.id, sort_by_parameter_order=True),
+        [{key: value for key, value in entry.items() if key != "visible"} | {"created_at": now} for entry in entries],
+    ).scalars().all()
+    session.info.setdefault("committed_changes", []).extend(
+        {**entry, "revision": revision} for entry, revision in zip(entries, revisions)
+    )
+
+    # Keep only the newest entries; older revisions force clients to resync
+    latest = connection.execute(func.max(ChangeLog.__table__.c.id).select()).scalar()
+    connection.execute(ChangeLog.__table__.delete().where(ChangeLog.__table__.c.id <= latest - settings.change_log_max_entries))
+
+@event.listens_for(SessionLocal, "after_flush")
+def _record_flushed_changes(session, flush_context):
+    entries = [change_entry(obj, "create") for obj in session.new]
+    for obj in session.dirty:
+        fields = _changed_fields(obj)
+        if fields:
+            entries.append(change_entry(obj, "update", fields))
+    entries.extend(change_entry(obj, "delete") for obj in session.deleted)
+    record_changes(session, entries)
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_committed_changes(session):
+    entries = session.info.pop("committed_changes", None)
+    if entries:
+        for listener in list(_change_listeners):
+            listener(entries)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back_changes(session):
+    session.info.pop("committed_changes", None)
+
+def add_change_listener(listener: Callable[[List[Dict[str, Any]]], None]) -> None:
+    """Register a callback invoked with the change entries of each commit, each tagged with its revision."""
+    _change_listeners.append(listener)
+
+def get_changes_since(db: Session, since: int, limit: int) -> Dict[str, Any]:
+    """Return change entries after a revision, or a reset marker if they were compacted away."""
+    oldest, latest = db.query(func.min(ChangeLog.id), func.max(ChangeLog.id)).one()
+    latest = latest or 0
+    if since > latest or (oldest is not None and since + 1 < oldest):
+        return {"revision": latest, "since": since, "reset": True, "has_more": False, "changes": []}
+
+    rows = db.query(ChangeLog).filter(ChangeLog.id > since).order_by(ChangeLog.id).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "revision": rows[-1].id if has_more else latest,
+        "since": since,
+        "reset": False,
+        "has_more": has_more,
+        "changes": [
+            {
+                "revision": row.id,
+                "table": row.table_name,
+                "id": row.row_id,
+                "op": row.op,
+                "changes": row.changes,
+                "created_at": row.created_at,
+            }
+            for row in rows
+        ],
+    }
@@ -1,15 +1,92 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON
+from sqlalchemy import create_engine, event, text, Column, ForeignKey, Index, Integer, String, Text, DateTime, Boolean, JSON, UniqueConstraint
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 from config import settings
 
+is_sqlite = settings.database_url.startswith("sqlite")
+is_sqlite_memory = is_sqlite and (":memory:" in settings.database_url or settings.database_url.rstrip("/") == "sqlite:")
+
+# Pool sizing: request handlers share async_engine's pool on the event loop,
+# while startup, migrations and background tasks use the sync engine. Both get
+# the same small pool with bounded overflow, since SQLite only allows one
+# writer however many connections wait on it.
+engine_kwargs = {}
+if not is_sqlite_memory:
+    engine_kwargs.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+
 # Create database engine using settings
 engine = create_engine(
     settings.database_url, 
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    connect_args={"check_same_thread": False} if is_sqlite else {},
+    **engine_kwargs
+)
+
+def sqlite_pragmas() -> dict:
+    """PRAGMAs applied to every new SQLite connection."""
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "cache_size": settings.sqlite_cache_size,
+        "mmap_size": settings.sqlite_mmap_size,
+        "temp_store": settings.sqlite_temp_store,
+        "foreign_keys": "ON",
+    }
+
+def async_database_url(url: str) -> str:
+    """Map a sync database URL to its asyncio driver."""
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    if url.startswith("postgresql:"):
+        return "postgresql+asyncpg:" + url[len("postgresql:"):]
+    return url
+
+# Async engine used by the request handlers; shares the pool settings and SQLite profile
+async_engine = create_async_engine(
+    settings.async_database_url or async_database_url(settings.database_url),
+    **engine_kwargs
 )
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the configured SQLite performance profile to a new connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma, value in sqlite_pragmas().items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+if is_sqlite:
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+def database_settings_report() -> dict:
+    """Effective database settings as reported by the engine and SQLite itself."""
+    report = {
+        "url": engine.url.render_as_string(hide_password=True),
+        "pool": engine.pool.status(),
+        "async_pool": async_engine.pool.status(),
+    }
+    if is_sqlite:
+        with engine.connect() as connection:
+            for pragma in sqlite_pragmas():
+                report[pragma] = connection.execute(text(f"PRAGMA {pragma}")).scalar()
+    return report
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async sessions wrap the same Session class, so session event hooks fire for both
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    sync_session_class=SessionLocal.class_,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
@@ -49,7 +126,7 @@ class Experience(Base):
     duration = Column(String(100), nullable=False)
     description = Column(Text, nullable=False)
     technologies = Column(String(500))  # Comma-separated list
-    achievements = Column(Text)  # Comma-separated list
+    achievements = Column(Text)  # Pipe-separated list
     location = Column(String(255))  # Job location
     is_active = Column(Boolean, default=True)
     order_index = Column(Integer, default=0)
@@ -209,8 +286,55 @@ class SectionConfig(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+class ChangeLog(Base):
+    """Content change feed; the id doubles as the global content revision."""
+    __tablename__ = "change_log"
+    __table_args__ = {"sqlite_autoincrement": True}
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String(100), nullable=False)
+    row_id = Column(Integer)
+    op = Column(String(10), nullable=False)  # create, update, delete
+    changes = Column(JSON)  # Changed fields and their new values
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class Tag(Base):
+    """Normalized value of a list field (a technology, skill or achievement)."""
+    __tablename__ = "tags"
+    __table_args__ = (UniqueConstraint("kind", "slug", name="uq_tags_kind_slug"),)
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)  # technologies, achievements, skills
+    name = Column(String(1000), nullable=False)  # As first entered
+    slug = Column(String(1000), nullable=False)  # Lowercased name used for lookups
+
+class ItemTag(Base):
+    """Association of a content row's list field with its tags, in list order."""
+    __tablename__ = "item_tags"
+    __table_args__ = (Index("ix_item_tags_tag_item", "tag_id", "table_name", "row_id"),)
+    table_name = Column(String(100), primary_key=True)
+    row_id = Column(Integer, primary_key=True)
+    field = Column(String(50), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), nullable=False)
+
+# Models listed in display order via is_active/order_index
+ORDERED_MODELS = [About, Experience, Stat, Testimonial, Project, ContactInfo, Award, Education, Certification, Skill, SectionTitle]
+
+# Composite indexes for the public list access path: WHERE is_active ORDER BY order_index
+ACTIVE_ORDER_INDEXES = [
+    Index(f"ix_{model.__tablename__}_active_order", model.is_active, model.order_index)
+    for model in ORDERED_MODELS
+] + [
+    Index("ix_projects_category_active_order", Project.category, Project.is_active, Project.order_index),
+    Index("ix_section_titles_name_active", SectionTitle.section_name, SectionTitle.is_active),
+    Index("ix_hero_active", Hero.is_active),
+]
+
+# Contact inbox access path: newest first, keyset on (created_at, id)
+CONTACT_INDEXES = [
+    Index("ix_contacts_created_id", Contact.created_at, Contact.id),
+]
+
+# Tables are created and upgraded by models.migrations.migrate() at startup
 
 # Database dependency
 def get_db():
@@ -219,4 +343,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    """Async database session dependency."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,119 @@
+"""Versioned schema migrations.
+
+Base.metadata.create_all() creates any missing tables; the numbered
+migrations below upgrade databases that already exist (e.g. the production
+portfolio.db on the Fly volume) in place. Applied versions are recorded in
+the schema_migrations table, so each migration runs exactly once.
+
+Usage:
+    python -m models.migrations
+"""
+import logging
+from datetime import datetime
+from typing import Callable, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from config import settings
+from models.database import Base, engine, is_sqlite, ACTIVE_ORDER_INDEXES, CONTACT_INDEXES
+from models.search import create_search_index
+from models.tags import backfill_tags
+
+logger = logging.getLogger(__name__)
+
+def _add_active_order_indexes(connection: Connection) -> None:
+    for index in ACTIVE_ORDER_INDEXES:
+        index.create(connection, checkfirst=True)
+
+def _backfill_tags(connection: Connection) -> None:
+    backfill_tags(connection)
+
+def _add_contact_inbox_indexes(connection: Connection) -> None:
+    for index in CONTACT_INDEXES:
+        index.create(connection, checkfirst=True)
+    if not is_sqlite:
+        return
+    # External-content FTS5 index over contacts, kept in sync by triggers
+    connection.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5("
+        "name, email, message, content='contacts', content_rowid='id')"
+    ))
+    connection.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS contacts_fts_insert AFTER INSERT ON contacts BEGIN "
+        "INSERT INTO contacts_fts(rowid, name, email, message) VALUES (new.id, new.name, new.email, new.message); END"
+    ))
+    connection.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS contacts_fts_delete AFTER DELETE ON contacts BEGIN "
+        "INSERT INTO contacts_fts(contacts_fts, rowid, name, email, message) VALUES ('delete', old.id, old.name, old.email, old.message); END"
+    ))
+    connection.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS contacts_fts_update AFTER UPDATE ON contacts BEGIN "
+        "INSERT INTO contacts_fts(contacts_fts, rowid, name, email, message) VALUES ('delete', old.id, old.name, old.email, old.message); "
+        "INSERT INTO contacts_fts(rowid, name, email, message) VALUES (new.id, new.name, new.email, new.message); END"
+    ))
+    connection.execute(text("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')"))
+
+def _add_search_index(connection: Connection) -> None:
+    if is_sqlite:
+        create_search_index(connection)
+
+# (version, name, upgrade) - append new migrations, never reorder or edit applied ones
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "add_active_order_indexes", _add_active_order_indexes),
+    (2, "backfill_tags", _backfill_tags),
+    (3, "add_contact_inbox_indexes", _add_contact_inbox_indexes),
+    (4, "add_search_index", _add_search_index),
+]
+
+def applied_versions(connection: Connection) -> List[int]:
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, applied_at DATETIME NOT NULL)"
+    ))
+    return [row[0] for row in connection.execute(text("SELECT version FROM schema_migrations ORDER BY version"))]
+
+# Held while migrating so processes starting together (uvicorn --workers N) run it one at a time
+MIGRATION_LOCK_ID = 0x706f7274
+MIGRATION_LOCK_WAIT_MS = 600000
+
+def _lock_schema(connection: Connection) -> None:
+    """Take a write lock held until the migration transaction ends."""
+    if is_sqlite:
+        # Migrations such as the search backfill can outlast the normal busy timeout
+        connection.exec_driver_sql(f"PRAGMA busy_timeout = {MIGRATION_LOCK_WAIT_MS}")
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+def _apply_pending(connection: Connection) -> List[int]:
+    _lock_schema(connection)
+    Base.metadata.create_all(bind=connection)
+    # Read only after taking the lock, so versions another process just applied are skipped
+    done = set(applied_versions(connection))
+    applied = []
+    for version, name, upgrade in MIGRATIONS:
+        if version in done:
+            continue
+        logger.info("Applying migration %s: %s", version, name)
+        upgrade(connection)
+        connection.execute(
+            text("INSERT INTO schema_migrations (version, name, applied_at) VALUES (:version, :name, :applied_at)"),
+            {"version": version, "name": name, "applied_at": datetime.utcnow()},
+        )
+        applied.append(version)
+    return applied
+
+def migrate() -> List[int]:
+    """Create missing tables and apply pending migrations under a write lock; returns the versions applied."""
+    with engine.connect() as connection:
+        try:
+            with connection.begin():
+                return _apply_pending(connection)
+        finally:
+            if is_sqlite:
+                # Back to the normal timeout before the connection returns to the pool
+                connection.exec_driver_sql(f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    versions = migrate()
+    print(f"Applied migrations: {versions}" if versions else "Database schema is up to date")
@@ -1,7 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+def split_list(value: Optional[str], separator: str = ",") -> List[str]:
+    """Split a delimited list field into trimmed, non-empty items."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(separator) if item.strip()]
+
 # Contact Models
 class ContactForm(BaseModel):
     name: str
@@ -89,6 +95,16 @@ class ExperienceResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @computed_field
+    @property
+    def technology_list(self) -> List[str]:
+        return split_list(self.technologies)
+
+    @computed_field
+    @property
+    def achievement_list(self) -> List[str]:
+        return split_list(self.achievements, "|")
+
     class Config:
         from_attributes = True
 
@@ -200,6 +216,11 @@ class ProjectResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @computed_field
+    @property
+    def technology_list(self) -> List[str]:
+        return split_list(self.technologies)
+
     class Config:
         from_attributes = True
 
@@ -272,6 +293,11 @@ class OrderUpdate(BaseModel):
     id: int
     order_index: int
 
+class MoveRequest(BaseModel):
+    """Place an item directly before or after another; neither moves it to the end."""
+    before_id: Optional[int] = None
+    after_id: Optional[int] = None
+
 class AwardCreate(BaseModel):
     title: str
     organization: str
@@ -386,6 +412,11 @@ class SkillResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @computed_field
+    @property
+    def skill_list(self) -> List[str]:
+        return split_list(self.skills)
+
     class Config:
         from_attributes = True
 
@@ -429,6 +460,80 @@ class SectionTitleResponse(BaseModel):
 class SectionConfig(BaseModel):
     config: Dict[str, Any]
 
+# Default configuration served until an admin saves one; matches frontend expectations
+DEFAULT_SECTION_CONFIG: Dict[str, Any] = {
+    "hero": {
+        "title": "I Am Rahul Raj",
+        "subtitle": "AVP Product",
+        "description": "Software Alchemist crafting digital experiences that users love & businesses value",
+        "badge": "Welcome to My Universe",
+        "badgeEmoji": "✨"
+    },
+    "about": {
+        "title": "Get to Know Me",
+        "description": "A glimpse into my world of innovation and creativity",
+        "whoIAm": {
+            "title": "Who I Am",
+            "description": "Product manager with designer's heart, diplomat's tongue & engineer's brain"
+        },
+        "whatIDo": {
+            "title": "What I Do",
+            "description": "Craft digital experiences that users love & businesses value"
+        },
+        "whatInterestsMe": {
+            "title": "What Interests Me",
+            "description": "Emerging tech, AI possibilities & real-world impact solutions"
+        }
+    },
+    "stats": {
+        "title": "My Journey",
+        "mainTitle": "Achievements & Skills",
+        "description": "A glimpse into my professional journey and expertise"
+    },
+    "projects": {
+        "title": "My Creations",
+        "mainTitle": "Amazing Projects",
+        "description": "Check out some of my favorite projects and creations! 🚀"
+    },
+    "experience": {
+        "title": "My Journey",
+        "mainTitle": "My Adventure So Far",
+        "description": "A colorful journey through the world of product management and innovation! 🌈"
+    },
+    "testimonials": {
+        "title": "What People Say",
+        "mainTitle": "Lovely Testimonials",
+        "description": "Hear what amazing people have to say about working with me! 💬"
+    },
+    "contact": {
+        "title": "Get In Touch",
+        "mainTitle": "Let's Connect",
+        "description": "Ready to work together? Let's create something amazing! 🚀"
+    },
+    "thankYou": {
+        "title": "Thank You",
+        "mainTitle": "Thanks for Reaching Out!",
+        "description": "I'll get back to you as soon as possible. In the meantime, feel free to explore more of my work!",
+        "emoji": "🎉"
+    },
+    "awards": {
+        "title": "Awards",
+        "description": "My awards and recognition"
+    },
+    "education": {
+        "title": "Education",
+        "description": "My educational background"
+    },
+    "certifications": {
+        "title": "Certifications",
+        "description": "My certifications"
+    },
+    "skills": {
+        "title": "Skills",
+        "description": "My technical skills"
+    }
+}
+
 class SectionConfigResponse(BaseModel):
     id: int
     config: Dict[str, Any]
@@ -438,6 +543,51 @@ class SectionConfigResponse(BaseModel):
     class Config:
         from_attributes = True
         
+# Change feed Models
+class ChangeEntry(BaseModel):
+    revision: int
+    table: str
+    id: Optional[int]
+    op: str  # create, update, delete
+    changes: Optional[Dict[str, Any]]
+    created_at: datetime
+
+class ChangeFeedResponse(BaseModel):
+    revision: int
+    since: int
+    reset: bool  # True when the requested revision was compacted away; refetch everything
+    has_more: bool
+    changes: List[ChangeEntry]
+
+# Bulk operation Models
+class BulkRequest(BaseModel):
+    create: List[Dict[str, Any]] = []
+    update: List[Dict[str, Any]] = []  # Each patch must include the item id
+    delete: List[int] = []
+
+class BulkItemResult(BaseModel):
+    op: str  # create, update, delete
+    index: int  # Position in the request list for this op
+    id: Optional[int] = None
+    status: str  # created, updated, deleted, not_found, invalid
+    error: Optional[str] = None
+    item: Optional[Dict[str, Any]] = None
+
+class BulkResponse(BaseModel):
+    created: int
+    updated: int
+    deleted: int
+    failed: int
+    results: List[BulkItemResult]
+
+# Search Models
+class SearchResult(BaseModel):
+    type: str  # Source table, e.g. projects, experiences
+    id: int
+    title: str  # HTML-escaped, matches wrapped in <mark>
+    snippet: str  # HTML-escaped excerpt of the body, matches wrapped in <mark>
+    score: float  # Higher is more relevant
+
 class AdminContactResponse(ContactResponse):
     pass
 
@@ -0,0 +1,135 @@
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import Table, bindparam, func, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from config import settings
+from models.database import SessionLocal
+from models.changelog import record_changes
+from models.revisions import bump_tables
+
+# Rank-based ordering
+# order_index values are sparse ranks spaced order_rank_gap apart. Moving an
+# item picks the midpoint between its new neighbours, so a move writes a
+# single row. When neighbours get too close the collection is respaced, either
+# inline (no room left at all) or in the background (room is running out).
+# Hand-entered ranks (0, 1, 2, ...) and the rank 0 every new item starts at
+# are left as they are until a move first needs room between them; a move
+# next to an anchor that shares its rank with other rows respaces first.
+
+logger = logging.getLogger(__name__)
+
+def rebalance_ranks(connection: Connection, table: Table) -> List[Tuple[int, int]]:
+    """Respace a table's ranks evenly in current order; returns the (id, rank) pairs that changed."""
+    rows = connection.execute(select(table.c.id, table.c.order_index).order_by(table.c.order_index, table.c.id)).all()
+    changed = [
+        (row_id, (position + 1) * settings.order_rank_gap)
+        for position, (row_id, rank) in enumerate(rows)
+        if rank != (position + 1) * settings.order_rank_gap
+    ]
+    if changed:
+        now = datetime.utcnow()
+        connection.execute(
+            table.update().where(table.c.id == bindparam("row_id")).values(order_index=bindparam("rank"), updated_at=now),
+            [{"row_id": row_id, "rank": rank} for row_id, rank in changed],
+        )
+    return changed
+
+def _rank_entries(db: Session, model, ranks: List[Tuple[int, int]]) -> List[dict]:
+    """Change entries for new ranks, flagging rows hidden from the public site."""
+    hidden = set(db.scalars(select(model.id).where(model.is_active.is_not(True)))) if ranks else set()
+    return [
+        {"table_name": model.__tablename__, "row_id": row_id, "op": "update", "changes": {"order_index": rank}, "visible": row_id not in hidden}
+        for row_id, rank in ranks
+    ]
+
+def rebalance(db: Session, model) -> int:
+    """Respace a model's ranks inside the session's transaction and log the changes."""
+    changed = rebalance_ranks(db.connection(), model.__table__)
+    record_changes(db, _rank_entries(db, model, changed))
+    return len(changed)
+
+def rebalance_in_background(model) -> None:
+    """Respace a model's ranks in its own session; meant for BackgroundTasks."""
+    db = SessionLocal()
+    try:
+        changed = rebalance(db, model)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Rebalancing %s failed", model.__tablename__)
+        return
+    finally:
+        db.close()
+    if changed:
+        bump_tables([model.__tablename__])
+        logger.info("Rebalanced %s ranks (%s rows)", model.__tablename__, changed)
+
+def _bounds(db: Session, model, item, before_id: Optional[int], after_id: Optional[int]) -> Tuple[Optional[int], Optional[int]]:
+    """Ranks of the neighbours the item should land between."""
+    others = select(model.order_index).where(model.id != item.id)
+    if before_id is not None or after_id is not None:
+        anchor = db.get(model, before_id if before_id is not None else after_id)
+        if anchor is None or anchor.id == item.id:
+            raise LookupError("anchor")
+        tied = select(model.id).where(model.order_index == anchor.order_index, model.id.not_in([item.id, anchor.id])).limit(1)
+        if db.scalar(tied) is not None:
+            # Rows tied with the anchor (new items all start at 0) leave no rank to pick: report no room
+            return anchor.order_index, anchor.order_index
+        if before_id is not None:
+            lower = db.scalar(others.where(model.order_index < anchor.order_index).order_by(model.order_index.desc()).limit(1))
+            return lower, anchor.order_index
+        upper = db.scalar(others.where(model.order_index > anchor.order_index).order_by(model.order_index).limit(1))
+        return anchor.order_index, upper
+    # No anchor: move to the end
+    return db.scalar(select(func.max(model.order_index)).where(model.id != item.id)), None
+
+def _rank_between(lower: Optional[int], upper: Optional[int]) -> Optional[int]:
+    if lower is None and upper is None:
+        return 0
+    if lower is None:
+        return upper - settings.order_rank_gap
+    if upper is None:
+        return lower + settings.order_rank_gap
+    if upper - lower < 2:
+        return None
+    return (lower + upper) // 2
+
+def move_item(db: Session, model, item_id: int, before_id: Optional[int] = None, after_id: Optional[int] = None) -> Tuple[Optional[object], bool]:
+    """Give an item the rank between its new neighbours; returns (item, needs_rebalance).
+
+    Returns (None, False) if the item does not exist and raises LookupError for a missing anchor.
+    The caller commits.
+    """
+    item = db.get(model, item_id)
+    if item is None:
+        return None, False
+
+    lower, upper = _bounds(db, model, item, before_id, after_id)
+    rank = _rank_between(lower, upper)
+    if rank is None:
+        # Neighbours or the anchor share a rank, or are adjacent: respace, then place again
+        rebalance(db, model)
+        db.expire_all()
+        item = db.get(model, item_id)
+        lower, upper = _bounds(db, model, item, before_id, after_id)
+        rank = _rank_between(lower, upper)
+
+    item.order_index = rank
+    gaps = [gap for gap in (rank - lower if lower is not None else None, upper - rank if upper is not None else None) if gap is not None]
+    return item, bool(gaps) and min(gaps) < settings.order_rank_min_gap
+
+def set_ranks(db: Session, model, ranks: List[Tuple[int, int]]) -> int:
+    """Assign explicit (id, rank) pairs with one batched UPDATE; unknown ids are ignored."""
+    existing = set(db.scalars(select(model.id).where(model.id.in_([row_id for row_id, _ in ranks]))))
+    ranks = [(row_id, rank) for row_id, rank in ranks if row_id in existing]
+    if not ranks:
+        return 0
+    table = model.__table__
+    db.execute(
+        table.update().where(table.c.id == bindparam("row_id")).values(order_index=bindparam("rank"), updated_at=datetime.utcnow()),
+        [{"row_id": row_id, "rank": rank} for row_id, rank in ranks],
+    )
+    record_changes(db, _rank_entries(db, model, ranks))
+    return len(ranks)
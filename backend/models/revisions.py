@@ -0,0 +1,84 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Set
+from sqlalchemy import event
+from models.database import SessionLocal
+
+# Content revision tracking
+# Every committed session bumps the revision of each table it wrote to, so
+# derived views (snapshots, caches) can tell whether they are stale without
+# touching the database.
+_lock = threading.Lock()
+_global_revision = 0
+_table_revisions: Dict[str, int] = {}
+_table_modified: Dict[str, float] = {}
+_started_at = time.time()
+_listeners: List[Callable[[Set[str]], None]] = []
+
+def _pending_tables(session) -> Set[str]:
+    return session.info.setdefault("changed_tables", set())
+
+@event.listens_for(SessionLocal, "after_flush")
+def _track_flushed_tables(session, flush_context):
+    """Record the tables touched by ORM unit-of-work writes."""
+    pending = _pending_tables(session)
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            pending.add(table)
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _track_bulk_statements(orm_execute_state):
+    """Record the tables touched by bulk insert/update/delete statements."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _pending_tables(orm_execute_state.session).add(table.name)
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_committed_tables(session):
+    tables = session.info.pop("changed_tables", None)
+    if tables:
+        bump_tables(tables)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back_tables(session):
+    session.info.pop("changed_tables", None)
+
+def bump_tables(tables: Iterable[str]) -> int:
+    """Mark tables as changed and notify listeners; returns the new global revision."""
+    global _global_revision
+    tables = set(tables)
+    if not tables:
+        return _global_revision
+    now = time.time()
+    with _lock:
+        _global_revision += 1
+        for table in tables:
+            _table_revisions[table] = _table_revisions.get(table, 0) + 1
+            _table_modified[table] = now
+        revision = _global_revision
+    for listener in list(_listeners):
+        listener(tables)
+    return revision
+
+def add_listener(listener: Callable[[Set[str]], None]) -> None:
+    """Register a callback invoked with the set of changed tables after each commit."""
+    _listeners.append(listener)
+
+def content_revision() -> int:
+    """Current global content revision for this process."""
+    return _global_revision
+
+def table_revision(table: str) -> int:
+    """Current revision of a single table."""
+    return _table_revisions.get(table, 0)
+
+
+def table_last_modified(table: str) -> float:
+    """Timestamp of the last committed write to a table, or process start if none."""
+    return _table_modified.get(table, _started_at)
+
+def process_started_at() -> float:
+    """Timestamp identifying this process's revision counters."""
+    return _started_at
@@ -0,0 +1,147 @@
+import html
+import re
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from models.database import Award, Certification, Education, Experience, Project, Skill, Testimonial
+
+# Site-wide full-text search
+# One FTS5 table, search_index, holds a title and body document per content
+# row. Its rowid packs the source row id and a table code, so the triggers
+# that keep it current on every insert/update/delete address documents by
+# rowid instead of scanning. Queries rank every match with bm25 (title
+# weighted above body) and return highlighted snippets.
+
+SEARCH_TABLE = "search_index"
+TABLE_CODE_BITS = 4
+
+# table code -> (model, title columns, body columns); never renumber a code
+SEARCH_SOURCES = {
+    1: (Project, ["title"], ["short_description", "description", "technologies", "category"]),
+    2: (Experience, ["position", "company"], ["description", "technologies", "achievements", "location"]),
+    3: (Testimonial, ["name", "company"], ["message", "position", "relation"]),
+    4: (Certification, ["name"], ["issuer", "certificate_id"]),
+    5: (Award, ["title"], ["organization", "year"]),
+    6: (Education, ["degree"], ["institution", "year"]),
+    7: (Skill, ["category"], ["skills"]),
+}
+SEARCH_TABLES = {model.__tablename__: code for code, (model, _, _) in SEARCH_SOURCES.items()}
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+def fts_query(q: str) -> Optional[str]:
+    """Turn free text into a safe FTS5 query: every word must match, the last as a prefix."""
+    tokens = _TOKEN.findall(q)
+    if not tokens:
+        return None
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+SNIPPET_WORDS = 16
+
+def _match_pattern(q: str) -> re.Pattern:
+    """Regex for the words fts_query matches, the last as a prefix."""
+    tokens = [re.escape(token) for token in _TOKEN.findall(q)]
+    tokens[-1] += r"\w*"
+    return re.compile(r"\b(?:" + "|".join(tokens) + r")\b", re.IGNORECASE)
+
+def _highlighted_html(value: str, pattern: re.Pattern) -> str:
+    """HTML-escape stored text and wrap matched words in <mark>."""
+    parts, position = [], 0
+    for found in pattern.finditer(value):
+        parts.append(html.escape(value[position:found.start()]))
+        parts.append(f"<mark>{html.escape(found.group())}</mark>")
+        position = found.end()
+    parts.append(html.escape(value[position:]))
+    return "".join(parts).strip()
+
+def _snippet(body: str, pattern: re.Pattern) -> str:
+    """A window of words around the first match in the body."""
+    words = body.split()
+    first = next((index for index, word in enumerate(words) if pattern.search(word)), 0)
+    start = max(0, min(first - SNIPPET_WORDS // 4, len(words) - SNIPPET_WORDS))
+    window = " ".join(words[start:start + SNIPPET_WORDS])
+    prefix = "… " if start > 0 else ""
+    suffix = " …" if start + SNIPPET_WORDS < len(words) else ""
+    return prefix + _highlighted_html(window, pattern) + suffix
+
+def _document(prefix: str, columns: List[str]) -> str:
+    return " || ' ' || ".join(f"coalesce({prefix}.{column}, '')" for column in columns)
+
+def _document_values(code: int, prefix: str) -> str:
+    _, title, body = SEARCH_SOURCES[code]
+    return f"({prefix}.id << {TABLE_CODE_BITS}) | {code}, {prefix}.is_active, {_document(prefix, title)}, {_document(prefix, body)}"
+
+def create_search_index(connection: Connection) -> None:
+    """Create the FTS5 table and its sync triggers, then index every existing row."""
+    connection.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        "is_active UNINDEXED, title, body, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    ))
+    columns = "rowid, is_active, title, body"
+    for code, (model, title, body) in SEARCH_SOURCES.items():
+        table = model.__tablename__
+        # Only the indexed columns re-tokenize the document; moves and flags like is_featured do not
+        indexed = ", ".join(title + body + ["is_active"])
+        connection.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {SEARCH_TABLE}({columns}) VALUES ({_document_values(code, 'new')}); END"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM {SEARCH_TABLE} WHERE rowid = (old.id << {TABLE_CODE_BITS}) | {code}; END"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE OF {indexed} ON {table} BEGIN "
+            f"DELETE FROM {SEARCH_TABLE} WHERE rowid = (old.id << {TABLE_CODE_BITS}) | {code}; "
+            f"INSERT INTO {SEARCH_TABLE}({columns}) VALUES ({_document_values(code, 'new')}); END"
+        ))
+        connection.execute(text(
+            f"INSERT INTO {SEARCH_TABLE}({columns}) SELECT {_document_values(code, table)} FROM {table}"
+        ))
+    connection.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')"))
+
+def search_content(db: Session, q: str, limit: int, tables: Optional[Sequence[str]] = None, include_inactive: bool = False) -> List[Dict[str, Any]]:
+    """Ranked matches with highlighted titles and body snippets.
+
+    bm25 is computed for every matching document before the top ones are
+    taken, so cost grows with the match count: a term found in most of 100k
+    documents takes a few hundred milliseconds. Portfolio content is far
+    smaller than that.
+    """
+    match = fts_query(q)
+    if match is None:
+        return []
+    conditions = [f"{SEARCH_TABLE} MATCH :match"]
+    if not include_inactive:
+        conditions.append("is_active = 1")
+    if tables:
+        codes = sorted(SEARCH_TABLES[table] for table in tables)
+        conditions.append(f"(rowid & {(1 << TABLE_CODE_BITS) - 1}) IN ({', '.join(map(str, codes))})")
+    ranked = db.execute(text(
+        f"SELECT rowid, bm25({SEARCH_TABLE}, 0.0, 10.0, 1.0) AS score FROM {SEARCH_TABLE} "
+        f"WHERE {' AND '.join(conditions)} ORDER BY score LIMIT :limit"
+    ), {"match": match, "limit": limit}).all()
+    if not ranked:
+        return []
+
+    # Highlighting in SQL would re-run the match, so fetch the few winning documents by rowid
+    documents = {
+        row.rowid: row
+        for row in db.execute(text(
+            f"SELECT rowid, title, body FROM {SEARCH_TABLE} WHERE rowid IN ({', '.join(str(row.rowid) for row in ranked)})"
+        ))
+    }
+    pattern = _match_pattern(q)
+    return [
+        {
+            "type": SEARCH_SOURCES[row.rowid & ((1 << TABLE_CODE_BITS) - 1)][0].__tablename__,
+            "id": row.rowid >> TABLE_CODE_BITS,
+            "title": _highlighted_html(documents[row.rowid].title, pattern),
+            "snippet": _snippet(documents[row.rowid].body, pattern),
+            "score": -row.score,
+        }
+        for row in ranked if row.rowid in documents
+    ]
@@ -0,0 +1,119 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event, inspect, select, tuple_
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from models.database import SessionLocal, Experience, ItemTag, Project, Skill, Tag
+from models.models import split_list
+
+# Tag tables
+# Delimited list columns are mirrored into tags/item_tags so they can be
+# filtered through an index. The string columns stay the source of truth;
+# item_tags is rewritten whenever one of them changes, for every changed row
+# of a flush or bulk write in one set of statements.
+
+# model -> {list column: separator}
+TAGGED_FIELDS = {
+    Project: {"technologies": ","},
+    Experience: {"technologies": ",", "achievements": "|"},
+    Skill: {"skills": ","},
+}
+TAGGED_TABLES = {model.__tablename__: fields for model, fields in TAGGED_FIELDS.items()}
+
+BACKFILL_CHUNK_ROWS = 500
+
+def tag_slug(name: str) -> str:
+    """Lookup key for a tag name."""
+    return name.strip().lower()
+
+def _tag_ids(connection: Connection, names: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+    """Map (kind, name) pairs to tag ids keyed by (kind, slug), creating missing tags."""
+    wanted: Dict[Tuple[str, str], str] = {}
+    for kind, name in names:
+        wanted.setdefault((kind, tag_slug(name)), name)
+    if not wanted:
+        return {}
+    tags = Tag.__table__
+
+    def lookup(keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        rows = connection.execute(select(tags.c.kind, tags.c.slug, tags.c.id).where(tuple_(tags.c.kind, tags.c.slug).in_(keys)))
+        return {(kind, slug): tag_id for kind, slug, tag_id in rows}
+
+    ids = lookup(list(wanted))
+    missing = [key for key in wanted if key not in ids]
+    if missing:
+        connection.execute(tags.insert(), [{"kind": kind, "name": wanted[kind, slug], "slug": slug} for kind, slug in missing])
+        ids.update(lookup(missing))
+    return ids
+
+def replace_tags(connection: Connection, table_name: str, values: Iterable[Tuple[int, str, Optional[str]]]) -> None:
+    """Rewrite the tag associations of (row id, list field, string value) triples with one DELETE and one INSERT."""
+    latest = {(row_id, field): value for row_id, field, value in values}
+    if not latest:
+        return
+    item_tags = ItemTag.__table__
+    connection.execute(item_tags.delete().where(
+        item_tags.c.table_name == table_name, tuple_(item_tags.c.row_id, item_tags.c.field).in_(list(latest))
+    ))
+    separators = TAGGED_TABLES[table_name]
+    lists = {key: split_list(value, separators[key[1]]) for key, value in latest.items()}
+    ids = _tag_ids(connection, ((field, name) for (_, field), names in lists.items() for name in names))
+    rows = []
+    for (row_id, field), names in lists.items():
+        seen = set()
+        for name in names:
+            tag_id = ids[field, tag_slug(name)]
+            if tag_id not in seen:
+                rows.append({"table_name": table_name, "row_id": row_id, "field": field, "position": len(seen), "tag_id": tag_id})
+                seen.add(tag_id)
+    if rows:
+        connection.execute(item_tags.insert(), rows)
+
+def remove_item_tags(connection: Connection, table_name: str, row_ids: Iterable[int]) -> None:
+    """Drop every tag association of deleted rows."""
+    item_tags = ItemTag.__table__
+    connection.execute(item_tags.delete().where(item_tags.c.table_name == table_name, item_tags.c.row_id.in_(list(row_ids))))
+
+def tag_values(obj, fields: Optional[Iterable[str]] = None) -> List[Tuple[int, str, Optional[str]]]:
+    """(row id, field, value) triples of an ORM object's list fields (all of them, or only the given ones)."""
+    tagged = TAGGED_TABLES.get(obj.__tablename__, {})
+    return [(obj.id, field, getattr(obj, field)) for field in (tagged if fields is None else fields) if field in tagged]
+
+def backfill_tags(connection: Connection) -> None:
+    """Populate item_tags from the existing string columns."""
+    for model, fields in TAGGED_FIELDS.items():
+        table = model.__table__
+        rows = connection.execute(select(table.c.id, *[table.c[field] for field in fields])).mappings().all()
+        # Chunked to stay under the database's bound parameter limit
+        for start in range(0, len(rows), BACKFILL_CHUNK_ROWS):
+            chunk = rows[start:start + BACKFILL_CHUNK_ROWS]
+            replace_tags(connection, model.__tablename__, [(row["id"], field, row[field]) for row in chunk for field in fields])
+
+def tagged_ids(table_name: str, field: str, name: str):
+    """Subquery of row ids whose list field contains a tag, resolved through the tag index."""
+    return (
+        select(ItemTag.row_id)
+        .join(Tag, Tag.id == ItemTag.tag_id)
+        .where(Tag.kind == field, Tag.slug == tag_slug(name), ItemTag.table_name == table_name)
+    )
+
+@event.listens_for(SessionLocal, "after_flush")
+def _sync_flushed_tags(session: Session, flush_context):
+    connection = session.connection()
+    values: Dict[str, List[Tuple[int, str, Optional[str]]]] = {}
+    for obj in session.new:
+        if obj.__tablename__ in TAGGED_TABLES:
+            values.setdefault(obj.__tablename__, []).extend(tag_values(obj))
+    for obj in session.dirty:
+        tagged = TAGGED_TABLES.get(getattr(obj, "__tablename__", None))
+        if tagged:
+            changed = [field for field in tagged if inspect(obj).attrs[field].history.has_changes()]
+            if changed:
+                values.setdefault(obj.__tablename__, []).extend(tag_values(obj, changed))
+    for table_name, table_values in values.items():
+        replace_tags(connection, table_name, table_values)
+    deleted: Dict[str, List[int]] = {}
+    for obj in session.deleted:
+        if obj.__tablename__ in TAGGED_TABLES:
+            deleted.setdefault(obj.__tablename__, []).append(obj.id)
+    for table_name, row_ids in deleted.items():
+        remove_item_tags(connection, table_name, row_ids)
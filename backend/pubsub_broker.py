@@ -0,0 +1,29 @@
+"""Run the pub/sub broker that relays WebSocket events between workers.
+
+Start one broker per host (or one reachable by every machine), then point
+each worker at it with PUBSUB_URL, e.g.:
+
+    python pubsub_broker.py --url unix:///tmp/portfolio-pubsub.sock
+    PUBSUB_URL=unix:///tmp/portfolio-pubsub.sock uvicorn main:app --workers 4
+
+Usage:
+    python pubsub_broker.py [--url tcp://127.0.0.1:8765]
+"""
+import argparse
+import asyncio
+import logging
+from api.pubsub import run_broker
+
+def main():
+    parser = argparse.ArgumentParser(description="Relay WebSocket events between API workers.")
+    parser.add_argument("--url", default="tcp://127.0.0.1:8765", help="tcp://host:port or unix:///path to listen on")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(run_broker(args.url))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
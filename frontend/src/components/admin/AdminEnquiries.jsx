@@ -2,10 +2,15 @@ import React, { useState, useEffect } from 'react';
 import { Mail, Calendar, User, MessageSquare, Trash2, RefreshCw, Loader2, Search, X } from 'lucide-react';
 import { getAdminContacts, deleteContactEnquiry } from '../../services/api';
 
+// Enquiries fetched per page; "Load more" follows the server's cursor
+const PAGE_SIZE = 50;
+
 const AdminEnquiries = () => {
   const [enquiries, setEnquiries] = useState([]);
-  const [filteredEnquiries, setFilteredEnquiries] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [hasLoaded, setHasLoaded] = useState(false);
   const [error, setError] = useState(null);
   const [success, setSuccess] = useState(null);
   const [selectedEnquiry, setSelectedEnquiry] = useState(null);
@@ -14,8 +19,10 @@ const AdminEnquiries = () => {
   const [deletingId, setDeletingId] = useState(null);
 
   useEffect(() => {
-    fetchEnquiries();
-  }, []);
+    // Search runs on the server; wait for typing to pause before refetching
+    const timeout = setTimeout(() => fetchEnquiries(), searchTerm ? 300 : 0);
+    return () => clearTimeout(timeout);
+  }, [searchTerm]);
 
   useEffect(() => {
     // Auto-refresh every 30 seconds if enabled
@@ -28,39 +35,36 @@ const AdminEnquiries = () => {
     return () => {
       if (interval) clearInterval(interval);
     };
-  }, [autoRefresh]);
-
-  useEffect(() => {
-    // Filter enquiries based on search term
-    if (!searchTerm.trim()) {
-      setFilteredEnquiries(enquiries);
-    } else {
-      const filtered = enquiries.filter(enquiry => 
-        enquiry.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        enquiry.email.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        enquiry.message.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-      setFilteredEnquiries(filtered);
-    }
-  }, [searchTerm, enquiries]);
+  }, [autoRefresh, searchTerm]);
 
   const fetchEnquiries = async () => {
     setLoading(true);
     setError(null);
     try {
-      const data = await getAdminContacts();
-      if (Array.isArray(data)) {
-        setEnquiries(data);
-        setFilteredEnquiries(data);
-      } else {
-        setEnquiries([]);
-        setFilteredEnquiries([]);
-      }
+      const { contacts, nextCursor: cursor } = await getAdminContacts({ limit: PAGE_SIZE, q: searchTerm.trim() });
+      setEnquiries(contacts);
+      setNextCursor(cursor);
     } catch (err) {
       setError('Failed to load enquiries. Please make sure you are logged in.');
       console.error('Error fetching enquiries:', err);
     } finally {
       setLoading(false);
+      setHasLoaded(true);
+    }
+  };
+
+  const loadMore = async () => {
+    setLoadingMore(true);
+    setError(null);
+    try {
+      const { contacts, nextCursor: cursor } = await getAdminContacts({ limit: PAGE_SIZE, cursor: nextCursor, q: searchTerm.trim() });
+      setEnquiries(current => [...current, ...contacts]);
+      setNextCursor(cursor);
+    } catch (err) {
+      setError('Failed to load more enquiries. Please try again.');
+      console.error('Error fetching enquiries:', err);
+    } finally {
+      setLoadingMore(false);
     }
   };
 
@@ -83,9 +87,7 @@ const AdminEnquiries = () => {
       console.log('Delete successful:', result);
       
       // Remove from local state
-      const updatedEnquiries = enquiries.filter(e => e.id !== id);
-      setEnquiries(updatedEnquiries);
-      setFilteredEnquiries(filteredEnquiries.filter(e => e.id !== id));
+      setEnquiries(current => current.filter(e => e.id !== id));
       
       if (selectedEnquiry?.id === id) {
         setSelectedEnquiry(null);
@@ -115,7 +117,7 @@ const AdminEnquiries = () => {
     });
   };
 
-  if (loading) {
+  if (loading && !hasLoaded) {
     return (
       <div className="flex items-center justify-center h-64">
         <div className="text-center">
@@ -192,13 +194,13 @@ const AdminEnquiries = () => {
         </div>
       )}
 
-      {enquiries.length === 0 ? (
+      {enquiries.length === 0 && !searchTerm ? (
         <div className="text-center py-16 bg-white rounded-2xl shadow-sm border border-gray-100">
           <Mail className="w-16 h-16 text-gray-300 mx-auto mb-4" />
           <h3 className="text-xl font-semibold text-gray-700 mb-2">No Enquiries Yet</h3>
           <p className="text-gray-500">Contact form submissions will appear here once visitors start reaching out.</p>
         </div>
-      ) : filteredEnquiries.length === 0 ? (
+      ) : enquiries.length === 0 ? (
         <div className="text-center py-16 bg-white rounded-2xl shadow-sm border border-gray-100">
           <Search className="w-16 h-16 text-gray-300 mx-auto mb-4" />
           <h3 className="text-xl font-semibold text-gray-700 mb-2">No Results Found</h3>
@@ -212,7 +214,7 @@ const AdminEnquiries = () => {
         </div>
       ) : (
         <div className="space-y-4">
-          {filteredEnquiries.map((enquiry) => (
+          {enquiries.map((enquiry) => (
             <div
               key={enquiry.id}
               className="bg-white rounded-2xl p-6 shadow-sm border border-gray-100 hover:shadow-md transition-all cursor-pointer"
@@ -278,9 +280,21 @@ const AdminEnquiries = () => {
         </div>
       )}
 
+      {nextCursor && (
+        <div className="text-center">
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="inline-flex items-center gap-2 px-5 py-2 bg-gray-200 text-gray-700 rounded-xl font-medium shadow hover:bg-gray-300 transition-all disabled:opacity-50"
+          >
+            {loadingMore && <Loader2 className="w-4 h-4 animate-spin" />} Load more
+          </button>
+        </div>
+      )}
+
       {enquiries.length > 0 && (
         <div className="text-center text-sm text-gray-500 mt-6">
-          Showing {filteredEnquiries.length} of {enquiries.length} {enquiries.length === 1 ? 'enquiry' : 'enquiries'}
+          Showing {enquiries.length}{nextCursor ? '+' : ''} {enquiries.length === 1 ? 'enquiry' : 'enquiries'}
           {searchTerm && ` (filtered by "${searchTerm}")`}
         </div>
       )}
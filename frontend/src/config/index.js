@@ -7,6 +7,8 @@ const config = {
   // API Configuration
   api: {
     baseURL: import.meta.env.VITE_API_BASE_URL || 'https://rahul-portfolio-backend.fly.dev',
+    // Read the public snapshot from this site's static export (see README) before the backend
+    staticContent: import.meta.env.VITE_STATIC_API === 'true',
     timeout: 30000, // 30 seconds
     retries: 3,
     retryDelay: 1000, // 1 second
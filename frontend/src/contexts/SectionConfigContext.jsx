@@ -1,5 +1,5 @@
 import React, { createContext, useContext, useState, useEffect } from 'react';
-import { getSectionConfig } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 import { connectWebSocket, disconnectWebSocket, addWebSocketListener, getWebSocketStatus, testWebSocket } from '../services/api';
 
 const SectionConfigContext = createContext();
@@ -100,7 +100,8 @@ export const SectionConfigProvider = ({ children }) => {
     try {
       setLoading(true);
       setError(null);
-      const response = await getSectionConfig();
+      // Shares the public sections' snapshot request on page load
+      const response = await getPortfolioSection('section_config');
       console.log('📦 Section config API response:', response);
       console.log('📦 Response type:', typeof response);
       console.log('📦 Response keys:', response ? Object.keys(response) : 'No response');
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { motion } from "framer-motion";
-import { submitContactForm, getContactInfo } from '../services/api';
+import { submitContactForm, getPortfolioSection } from '../services/api';
 import { useSectionConfig } from '../contexts/SectionConfigContext';
 
 const ContactSection = () => {
@@ -17,7 +17,7 @@ const ContactSection = () => {
   useEffect(() => {
     const fetchContactInfo = async () => {
       try {
-        const data = await getContactInfo();
+        const data = await getPortfolioSection('contact_info');
         setContactInfo(data);
       } catch {
         setContactInfo([]);
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { motion, AnimatePresence } from "framer-motion";
-import { getExperiences } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 import { useSectionConfig } from '../contexts/SectionConfigContext';
 
 const ExperienceSection = () => {
@@ -15,7 +15,7 @@ const ExperienceSection = () => {
       try {
         setLoading(true);
         setError(null);
-        const data = await getExperiences();
+        const data = await getPortfolioSection('experiences');
         if (data && data.length > 0) {
           // Transform the data to match the component's expected structure
           const transformedData = data.map(exp => ({
@@ -2,7 +2,7 @@ import React, { useState, useEffect } from "react";
 import { motion } from "framer-motion";
 import Lottie from "lottie-react";
 import wolfAnimation from "../lottie/wolf.json";
-import { getHero } from "../services/api";
+import { getPortfolioSection } from "../services/api";
 
 const CloudSVG = ({ className }) => (
   <svg width="100" height="60" viewBox="0 0 100 60" fill="none" xmlns="http://www.w3.org/2000/svg" className={className}>
@@ -20,7 +20,7 @@ const HeroSection = () => {
   useEffect(() => {
     const fetchHeroData = async () => {
       try {
-        const data = await getHero();
+        const data = await getPortfolioSection('hero');
         setHeroData(data);
       } catch (err) {
         setError('Failed to load hero section data');
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { motion } from "framer-motion";
-import { getAboutContent } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 import { useSectionConfig } from '../contexts/SectionConfigContext';
 
 const NewAboutSection = () => {
@@ -14,7 +14,7 @@ const NewAboutSection = () => {
       try {
         setLoading(true);
         setError(null);
-        const data = await getAboutContent();
+        const data = await getPortfolioSection('about');
         if (data && data.length > 0) {
           setAboutData(data);
         } else {
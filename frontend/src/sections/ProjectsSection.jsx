@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
-import { getProjects } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 import { useSectionConfig } from '../contexts/SectionConfigContext';
 
 const PROJECT_SCHEMA_KEY = '__projectSchema';
@@ -58,7 +58,7 @@ const ProjectsSection = () => {
       try {
         setLoading(true);
         setError(null);
-        const data = await getProjects();
+        const data = await getPortfolioSection('projects');
         if (Array.isArray(data) && data.length > 0) {
           const parsed = data.map(parseProject).sort(
             (a, b) => (a.order_index || 0) - (b.order_index || 0)
@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from "react";
-import { getStats } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 
 const StatsCounterSection = () => {
   const [stats, setStats] = useState([]);
@@ -9,7 +9,7 @@ const StatsCounterSection = () => {
   useEffect(() => {
     const fetchStats = async () => {
       try {
-        const data = await getStats();
+        const data = await getPortfolioSection('stats');
         setStats(data);
       } catch (err) {
         setError('Failed to load stats data');
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { motion, AnimatePresence } from "framer-motion";
-import { getStats, getAwards, getEducation, getCertifications, getSkills } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 import { useSectionConfig } from '../contexts/SectionConfigContext';
 
 const StatsSection = () => {
@@ -25,11 +25,11 @@ const StatsSection = () => {
     const fetchAllData = async () => {
       try {
         const [statsData, awardsData, educationData, certificationsData, skillsData] = await Promise.all([
-          getStats(),
-          getAwards(),
-          getEducation(),
-          getCertifications(),
-          getSkills()
+          getPortfolioSection('stats'),
+          getPortfolioSection('awards'),
+          getPortfolioSection('education'),
+          getPortfolioSection('certifications'),
+          getPortfolioSection('skills')
         ]);
 
         setStats(statsData || []);
@@ -1,7 +1,7 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { ChevronLeft, ChevronRight, X, Quote, Star } from 'lucide-react';
-import { getTestimonials } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 import { useSectionConfig } from '../contexts/SectionConfigContext';
 
 const TestimonialsSection = () => {
@@ -53,7 +53,7 @@ const TestimonialsSection = () => {
       try {
         setLoading(true);
         setError(null);
-        const data = await getTestimonials();
+        const data = await getPortfolioSection('testimonials');
         if (data && data.length > 0) {
           setTestimonials(data);
         } else {
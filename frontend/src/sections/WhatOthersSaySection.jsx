@@ -1,5 +1,5 @@
 import { useState, useEffect, useRef } from 'react';
-import { getTestimonials } from '../services/api';
+import { getPortfolioSection } from '../services/api';
 
 const CARD_HEIGHT = 260;
 const CARD_GAP = 32;
@@ -29,7 +29,7 @@ const WhatOthersSaySection = () => {
   useEffect(() => {
     const fetchTestimonials = async () => {
       try {
-        const data = await getTestimonials();
+        const data = await getPortfolioSection('testimonials');
         setTestimonials(data);
       } catch (err) {
         setError('Failed to load testimonials');
@@ -14,6 +14,15 @@ const reconnectDelay = 1000; // 1 second
 // WebSocket event listeners
 const websocketListeners = new Set();
 
+// Topics requested on top of the server defaults, re-sent after every reconnect
+const websocketTopics = new Set();
+
+const sendWebSocketRequest = (action, topics) => {
+  if (websocket && websocket.readyState === WebSocket.OPEN && topics.length) {
+    websocket.send(JSON.stringify({ action, topics }));
+  }
+};
+
 export const connectWebSocket = () => {
   if (websocket && websocket.readyState === WebSocket.OPEN) {
     return; // Already connected
@@ -27,11 +36,19 @@ export const connectWebSocket = () => {
     websocket.onopen = () => {
       console.log('✅ WebSocket connected successfully');
       reconnectAttempts = 0;
+      sendWebSocketRequest('subscribe', [...websocketTopics]);
     };
 
     websocket.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data);
+
+        // Answer server heartbeats so the connection is not reaped as idle
+        if (data.type === 'ping') {
+          websocket.send(JSON.stringify({ action: 'pong' }));
+          return;
+        }
+
         console.log('📨 WebSocket message received:', data);
         
         // Notify all listeners
@@ -87,6 +104,20 @@ export const removeWebSocketListener = (listener) => {
   websocketListeners.delete(listener);
 };
 
+/**
+ * Receive content_changed events for these topics (table names, or '*' for all)
+ * @param {string[]} topics - Topics to subscribe to
+ * @returns {Function} Unsubscribe function
+ */
+export const subscribeWebSocketTopics = (topics) => {
+  topics.forEach(topic => websocketTopics.add(topic));
+  sendWebSocketRequest('subscribe', topics);
+  return () => {
+    topics.forEach(topic => websocketTopics.delete(topic));
+    sendWebSocketRequest('unsubscribe', topics);
+  };
+};
+
 // Get WebSocket status for debugging
 export const getWebSocketStatus = () => {
   if (!websocket) {
@@ -143,16 +174,18 @@ const removeAuthToken = () => {
  */
 const apiFetch = async (url, options = {}, retries = config.api.retries) => {
   const token = getAuthToken();
+  // onHeaders(headers) is called with the response headers of a successful request
+  const { onHeaders, ...fetchOptions } = options;
   
   const defaultOptions = {
     headers: {
       'Content-Type': 'application/json',
       ...(token && { 'Authorization': `Bearer ${token}` }),
-      ...options.headers,
+      ...fetchOptions.headers,
     },
   };
 
-  const finalOptions = { ...defaultOptions, ...options };
+  const finalOptions = { ...defaultOptions, ...fetchOptions };
 
   for (let attempt = 1; attempt <= retries; attempt++) {
     try {
@@ -184,6 +217,9 @@ const apiFetch = async (url, options = {}, retries = config.api.retries) => {
       }
       
       // Handle successful responses
+      if (onHeaders) {
+        onHeaders(response.headers);
+      }
       if (response.status === 204) {
         return null; // No content
       }
@@ -235,6 +271,84 @@ export const checkBackendHealth = async () => {
   }
 };
 
+/**
+ * Fetch every public section in a single request
+ * @returns {Promise<Object>} Portfolio snapshot keyed by section
+ */
+export const getPortfolio = async () => {
+  if (config.api.staticContent) {
+    try {
+      // Same origin: the CDN rewrites /api/portfolio to the exported api/portfolio.json
+      const response = await fetch('/api/portfolio');
+      if (response.ok) {
+        return await response.json();
+      }
+    } catch (error) {
+      console.warn('Static portfolio snapshot unavailable, using the API:', error);
+    }
+  }
+  try {
+    const response = await apiFetch('/api/portfolio');
+    return response;
+  } catch (error) {
+    console.error('Error fetching portfolio snapshot:', error);
+    throw error;
+  }
+};
+
+// Snapshot request shared by the public sections that mount together
+let portfolioRequest = null;
+
+/**
+ * One public section from the portfolio snapshot; concurrent callers share a single request
+ * @param {string} key - Snapshot key, e.g. 'hero', 'stats', 'contact_info'
+ * @returns {Promise<Object|Array>} The section's data
+ */
+export const getPortfolioSection = async (key) => {
+  if (!portfolioRequest) {
+    portfolioRequest = getPortfolio().finally(() => {
+      portfolioRequest = null;
+    });
+  }
+  const portfolio = await portfolioRequest;
+  return portfolio ? portfolio[key] : null;
+};
+
+/**
+ * Fetch content changes after a known revision (admin only)
+ * @param {number} since - Last revision the client has applied
+ * @returns {Promise<Object>} Change feed; `reset: true` means refetch everything
+ */
+export const getChanges = async (since = 0) => {
+  try {
+    const response = await apiFetch(`/api/changes?since=${since}`);
+    return response;
+  } catch (error) {
+    console.error('Error fetching content changes:', error);
+    throw error;
+  }
+};
+
+/**
+ * Full-text search across portfolio content
+ * @param {string} q - Search text
+ * @param {string[]} types - Optional content types, e.g. ['projects', 'skills']
+ * @returns {Promise<Array>} Ranked results with HTML-escaped, <mark>-highlighted title and snippet
+ */
+export const searchContent = async (q, types = []) => {
+  try {
+    const params = new URLSearchParams({ q });
+    if (types.length) {
+      params.set('types', types.join(','));
+    }
+    const response = await apiFetch(`/api/search?${params}`);
+    return response;
+  } catch (error) {
+    console.error('Error searching content:', error);
+    throw error;
+  }
+};
+
 /**
  * Contact form submission
  * @param {Object} formData - Contact form data
@@ -292,6 +406,43 @@ export const updateAboutOrder = async (orderData) => {
   }
 };
 
+/**
+ * Move an item within any ordered collection (e.g. 'projects', 'contact-info')
+ * @param {string} collection - Collection URL segment
+ * @param {number} id - Item to move
+ * @param {Object} position - { before_id } or { after_id }; empty moves it to the end
+ */
+export const moveItem = async (collection, id, position = {}) => {
+  try {
+    const response = await apiFetch(`/api/${collection}/${id}/move`, {
+      method: 'POST',
+      body: JSON.stringify(position),
+    });
+    return response;
+  } catch (error) {
+    console.error(`Error moving ${collection} item:`, error);
+    throw error;
+  }
+};
+
+/**
+ * Apply many creates, patches and deletes to a collection in one request
+ * @param {string} collection - Collection URL segment
+ * @param {Object} batch - { create: [...], update: [{ id, ...fields }], delete: [ids] }
+ */
+export const bulkUpdateCollection = async (collection, batch) => {
+  try {
+    const response = await apiFetch(`/api/${collection}/bulk`, {
+      method: 'POST',
+      body: JSON.stringify(batch),
+    });
+    return response;
+  } catch (error) {
+    console.error(`Error applying bulk ${collection} changes:`, error);
+    throw error;
+  }
+};
+
 /**
  * Experience section API functions
  */
@@ -373,11 +524,14 @@ export const updateTestimonial = async (id, testimonialData) => {
 /**
  * Projects section API functions
  */
-export const getProjects = async (category = null) => {
+export const getProjects = async (category = null, technology = null) => {
   try {
-    const url = category 
+    let url = category 
       ? `/api/projects/${category}`
       : '/api/projects';
+    if (technology && !category) {
+      url += `?technology=${encodeURIComponent(technology)}`;
+    }
     const response = await apiFetch(url);
     return response;
   } catch (error) {
@@ -402,10 +556,21 @@ export const updateProject = async (id, projectData) => {
 /**
  * Admin endpoints with enhanced error handling
  */
-export const getAdminContacts = async () => {
-  try {
-    const response = await apiFetch('/api/admin/contacts');
-    return response;
+/**
+ * Fetch one page of contact enquiries, newest first
+ * @param {Object} params - limit, cursor, since, until, email, q (full-text search)
+ * @returns {Promise<Object>} { contacts, nextCursor }; nextCursor is null on the last page
+ */
+export const getAdminContacts = async (params = {}) => {
+  try {
+    const query = new URLSearchParams(
+      Object.entries(params).filter(([, value]) => value !== undefined && value !== null && value !== '')
+    ).toString();
+    let nextCursor = null;
+    const response = await apiFetch(`/api/admin/contacts${query ? `?${query}` : ''}`, {
+      onHeaders: (headers) => { nextCursor = headers.get('X-Next-Cursor'); },
+    });
+    return { contacts: Array.isArray(response) ? response : [], nextCursor };
   } catch (error) {
     console.error('Error fetching admin contacts:', error);
     if (error.message.includes('Authentication failed')) {
@@ -417,29 +582,35 @@ export const getAdminContacts = async () => {
 
 export const deleteContactEnquiry = async (contactId) => {
   try {
-    // Ensure contactId is a number/string
     const id = typeof contactId === 'number' ? contactId : parseInt(contactId, 10);
-    console.log('Delete API call - contactId:', contactId, 'parsed as:', id);
-    
     if (isNaN(id)) {
       throw new Error(`Invalid contact ID: ${contactId}`);
     }
     
-    const url = `/api/admin/contacts/${id}`;
-    console.log('Delete URL:', url);
-    
-    const response = await apiFetch(url, {
+    const response = await apiFetch(`/api/admin/contacts/${id}`, {
       method: 'DELETE',
     });
-    console.log('Delete response:', response);
     return response || true;
   } catch (error) {
     console.error('Error deleting contact enquiry:', error);
-    console.error('Error details:', {
-      message: error.message,
-      contactId: contactId,
-      type: typeof contactId
+    throw error;
+  }
+};
+
+/**
+ * Delete several enquiries at once
+ * @param {Object} criteria - { ids: [1, 2] } or { olderThan: '2024-01-01T00:00:00' }
+ * @returns {Promise<Object>} Result with the number of enquiries deleted
+ */
+export const purgeContactEnquiries = async ({ ids, olderThan } = {}) => {
+  try {
+    const query = ids ? `ids=${ids.join(',')}` : `older_than=${encodeURIComponent(olderThan)}`;
+    const response = await apiFetch(`/api/admin/contacts?${query}`, {
+      method: 'DELETE',
     });
+    return response;
+  } catch (error) {
+    console.error('Error deleting contact enquiries:', error);
     throw error;
   }
 };